@@ -1,23 +1,38 @@
+import asyncio
+import importlib
+import logging
+import os
+import posixpath
+import queue
+import threading
+from pathlib import Path
+
 from pydantic import Field, ValidationInfo, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict, SettingsError
 from typing_extensions import Self
 
-from docling.backend.docling_parse_backend import DoclingParseDocumentBackend
-from docling.backend.docling_parse_v2_backend import DoclingParseV2DocumentBackend
-from docling.backend.docling_parse_v4_backend import DoclingParseV4DocumentBackend
 from docling.backend.pdf_backend import PdfDocumentBackend
-from docling.backend.pypdfium2_backend import PyPdfiumDocumentBackend
 from docling.datamodel.pipeline_options import (
     PdfBackend,
 )
 from docling.datamodel.service.sources import S3Coordinates
+from docling.utils.model_downloader import download_models
+from docling_core.types.io import DocumentStream
 
 from docling_jobkit.connectors.s3.helper import (
-    check_target_has_source_converted,
-    generate_presign_url,
-    get_s3_connection,
-    get_source_files,
+    create_s3_client,
+    filter_converted_source_keys,
+    filter_source_keys_by_format,
+    generate_presign_urls,
+    get_converted_source_root,
+    get_converted_target_stems,
+    get_s3_objects_last_modified,
+    get_source_key_prefix,
+    head_converted_target_stems,
+    list_source_files,
+    prefetch_s3_objects,
 )
+from docling_jobkit.connectors.s3.target_processor import S3TargetProcessor
 from docling_jobkit.convert.manager import (
     DoclingConverterManager,
     DoclingConverterManagerConfig,
@@ -28,6 +43,27 @@ from docling_jobkit.datamodel.convert import ConvertDocumentsOptions
 # from docling_jobkit.datamodel.convert import ConvertDocumentsOptions
 # from docling.datamodel.service.sources import S3Coordinates
 
+# Only the selected backend is imported, the others pull in native libraries
+# which are not needed for the run.
+_PDF_BACKENDS: dict[str, tuple[str, str]] = {
+    PdfBackend.DLPARSE_V1: (
+        "docling.backend.docling_parse_backend",
+        "DoclingParseDocumentBackend",
+    ),
+    PdfBackend.DLPARSE_V2: (
+        "docling.backend.docling_parse_v2_backend",
+        "DoclingParseV2DocumentBackend",
+    ),
+    PdfBackend.DLPARSE_V4: (
+        "docling.backend.docling_parse_v4_backend",
+        "DoclingParseV4DocumentBackend",
+    ),
+    PdfBackend.PYPDFIUM2: (
+        "docling.backend.pypdfium2_backend",
+        "PyPdfiumDocumentBackend",
+    ),
+}
+
 
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file="./dev/.env")
@@ -46,6 +82,28 @@ class Settings(BaseSettings):
     target_ssl: bool = Field(validation_alias="S3_TARGET_SSL")
     omp_num_threads: int = Field(validation_alias="OMP_NUM_THREADS")
     batch_size: int = Field(validation_alias="BATCH_SIZE")
+    list_parallel: bool = Field(False, validation_alias="S3_LIST_PARALLEL")
+    list_shard_chars: str | None = Field(None, validation_alias="S3_LIST_SHARD_CHARS")
+    prefetch: bool = Field(True, validation_alias="S3_PREFETCH")
+    bundle_exports: bool = Field(False, validation_alias="S3_BUNDLE_EXPORTS")
+    reconvert_modified: bool = Field(False, validation_alias="S3_RECONVERT_MODIFIED")
+    head_converted_check: bool = Field(
+        False, validation_alias="S3_HEAD_CONVERTED_CHECK"
+    )
+    models_cache_path: Path = Field(
+        Path("./models_cache"), validation_alias="MODELS_CACHE_PATH"
+    )
+    device: str = Field("auto", validation_alias="SETTINGS_DEVICE")
+    ocr_batch_size: int | None = Field(None, validation_alias="SETTINGS_OCR_BATCH_SIZE")
+    layout_batch_size: int | None = Field(
+        None, validation_alias="SETTINGS_LAYOUT_BATCH_SIZE"
+    )
+    table_batch_size: int | None = Field(
+        None, validation_alias="SETTINGS_TABLE_BATCH_SIZE"
+    )
+    doc_concurrency: int | None = Field(
+        None, validation_alias="SETTINGS_DOC_CONCURRENCY"
+    )
 
     do_ocr: bool = Field(True, validation_alias="SETTINGS_DO_OCR")
     ocr_kind: str = Field("auto", validation_alias="SETTINGS_OCR_KIND")
@@ -75,8 +133,8 @@ class Settings(BaseSettings):
     generate_picture_images: bool = Field(
         False, validation_alias="SETTINGS_PICTURE_PAGE_IMAGES"
     )
-    pdf_backend: type[PdfDocumentBackend] = Field(
-        DoclingParseV4DocumentBackend, validation_alias="SETTINGS_PDF_BACKEND"
+    pdf_backend: PdfBackend = Field(
+        PdfBackend.DLPARSE_V4, validation_alias="SETTINGS_PDF_BACKEND"
     )
 
     @field_validator("batch_size")
@@ -86,21 +144,16 @@ class Settings(BaseSettings):
         else:
             return v
 
-    @field_validator("pdf_backend", mode="before")
+    @field_validator("pdf_backend")
     def check_pdf_backend(cls, v, info: ValidationInfo):
-        if isinstance(v, str):
-            if v == PdfBackend.DLPARSE_V1:
-                return DoclingParseDocumentBackend
-            elif v == PdfBackend.DLPARSE_V2:
-                return DoclingParseV2DocumentBackend
-            elif v == PdfBackend.DLPARSE_V4:
-                return DoclingParseV4DocumentBackend
-            elif v == PdfBackend.PYPDFIUM2:
-                return PyPdfiumDocumentBackend
-            else:
-                raise SettingsError(f"Unexpected PDF backend type {v}")
-        else:
-            return v
+        if v not in _PDF_BACKENDS:
+            raise SettingsError(f"Unexpected PDF backend type {v}")
+        return v
+
+    @property
+    def pdf_backend_class(self) -> type[PdfDocumentBackend]:
+        module_name, class_name = _PDF_BACKENDS[self.pdf_backend]
+        return getattr(importlib.import_module(module_name), class_name)
 
     @model_validator(mode="after")
     def check_source_target_is_not_same(self) -> Self:
@@ -114,6 +167,7 @@ class Settings(BaseSettings):
             return self
 
 
+logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler()], force=True)
 settings = Settings()
 
 # We already checked envs but in deployment the inputs arrive as json
@@ -137,8 +191,8 @@ s3_target: dict = {
 }
 
 # validate s3 inputs
-s3_coords_source = S3Coordinates.model_validate(s3_source)
-s3_target_coords = S3Coordinates.model_validate(s3_target)
+s3_coords_source = S3Coordinates(**s3_source)
+s3_target_coords = S3Coordinates(**s3_target)
 
 # Imitate conversion options json
 # Load conversion settings
@@ -150,7 +204,7 @@ input_convertion_options: dict = {
     "force_ocr": False,
     "ocr_engine": settings.ocr_kind,
     "ocr_lang": ["en"],
-    "pdf_backend": "dlparse_v4",
+    "pdf_backend": settings.pdf_backend.value,
     "table_mode": settings.table_structure_mode,
     "abort_on_error": False,
     "return_as_file": False,
@@ -165,35 +219,182 @@ input_convertion_options: dict = {
 }
 
 # validate inputs
-convert_options = ConvertDocumentsOptions.model_validate(input_convertion_options)
+convert_options = ConvertDocumentsOptions(**input_convertion_options)
+
 
+s3_source_client = create_s3_client(s3_coords_source)
 
-s3_source_client, s3_source_resource = get_s3_connection(s3_coords_source)
-source_objects_list = get_source_files(
-    s3_source_client, s3_source_resource, s3_coords_source
+# Listing, target filtering and presigning run in a producer thread which feeds
+# a bounded queue, so S3 latency overlaps with the conversion of the first
+# documents instead of delaying it. Presigned urls are kept one batch ahead of
+# the converter; prefetched documents are already buffered (and bounded in
+# bytes) by prefetch_s3_objects, so the queue only hands them over.
+_PRODUCER_DONE = object()
+presign_queue: queue.Queue = queue.Queue(
+    maxsize=1 if settings.prefetch else settings.batch_size
 )
-filtered_source_keys = check_target_has_source_converted(
-    s3_target_coords, source_objects_list, s3_coords_source.key_prefix
+
+
+async def _list_source_and_target():
+    # The source listing and the sweep of already converted outputs are
+    # independent, run them side by side instead of one after the other.
+    source_listing = (
+        asyncio.to_thread(
+            get_s3_objects_last_modified,
+            s3_source_client,
+            s3_coords_source.bucket,
+            get_source_key_prefix(s3_coords_source),
+        )
+        if settings.reconvert_modified
+        else asyncio.to_thread(
+            list_source_files,
+            s3_source_client,
+            s3_coords_source,
+            max_workers=settings.omp_num_threads if settings.list_parallel else None,
+            shard_chars=settings.list_shard_chars,
+        )
+    )
+    if settings.head_converted_check:
+        # The outputs are looked up per source key once the sources are known
+        return await source_listing, None
+    return await asyncio.gather(
+        source_listing,
+        asyncio.to_thread(
+            get_converted_target_stems, s3_target_coords, s3_coords_source
+        ),
+    )
+
+
+def _produce_presigned_urls():
+    try:
+        source_objects_list, target_stems = asyncio.run(_list_source_and_target())
+        # With S3_RECONVERT_MODIFIED the source listing carries LastModified,
+        # documents changed since their output was written are converted again.
+        source_keys = filter_source_keys_by_format(
+            source_objects_list, convert_options.from_formats
+        )
+        if target_stems is None:
+            target_stems = head_converted_target_stems(
+                s3_target_coords, s3_coords_source, source_keys
+            )
+        filtered_source_keys = filter_converted_source_keys(
+            source_keys,
+            target_stems,
+            source_objects_list if isinstance(source_objects_list, dict) else None,
+        )
+        # With prefetching the documents are downloaded concurrently and handed
+        # to docling as streams, instead of docling fetching each presigned url
+        # one after the other.
+        # The prefetched streams are renamed to the file name of their key, so
+        # the outputs keep the flat json/<name>.json layout of presigned urls.
+        sources = (
+            (
+                DocumentStream(
+                    name=posixpath.basename(stream.name), stream=stream.stream
+                )
+                for stream in prefetch_s3_objects(
+                    s3_source_client,
+                    filtered_source_keys,
+                    s3_coords_source.bucket,
+                    max_workers=settings.omp_num_threads,
+                )
+            )
+            if settings.prefetch
+            else generate_presign_urls(
+                s3_source_client,
+                filtered_source_keys,
+                s3_coords_source.bucket,
+                max_workers=settings.omp_num_threads,
+            )
+        )
+        for source in sources:
+            presign_queue.put(source)
+    except Exception as exc:
+        presign_queue.put(exc)
+    finally:
+        presign_queue.put(_PRODUCER_DONE)
+
+
+def _iter_presigned_urls():
+    while True:
+        try:
+            item = presign_queue.get(timeout=1.0)
+        except queue.Empty:
+            if producer.is_alive():
+                continue
+            return
+        if item is _PRODUCER_DONE:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+producer = threading.Thread(target=_produce_presigned_urls, daemon=True)
+producer.start()
+presign_filtered_source_keys = _iter_presigned_urls()
+
+
+def _resolve_models_path(models_cache: Path, with_easyocr: bool) -> Path:
+    # The sentinel is written only after a complete download, so warm restarts
+    # skip download_models (and its per-file checks) entirely.
+    sentinel = models_cache / ".complete"
+    if sentinel.exists():
+        return models_cache
+    models_path = download_models(output_dir=models_cache, with_easyocr=with_easyocr)
+    sentinel.touch()
+    return models_path
+
+
+# EasyOCR is imported lazily by docling, so pointing it at the shared cache here
+# is early enough to avoid a second download into ~/.EasyOCR.
+os.environ.setdefault(
+    "EASYOCR_MODULE_PATH", str(settings.models_cache_path / "EasyOcr")
+)
+models_path = _resolve_models_path(
+    settings.models_cache_path, with_easyocr=settings.ocr_kind == "easyocr"
 )
 
-presign_filtered_source_keys = [
-    generate_presign_url(s3_source_client, key, s3_coords_source.bucket)
-    for key in filtered_source_keys
-]
+# The .env file is not exported to the environment, forward the accelerator
+# settings docling reads from it (AcceleratorOptions uses the DOCLING_ prefix).
+os.environ.setdefault("DOCLING_DEVICE", settings.device)
+os.environ.setdefault("OMP_NUM_THREADS", str(settings.omp_num_threads))
 
-config = DoclingConverterManagerConfig()
+# The threaded standard pipeline batches pages per stage; larger OCR/layout/
+# table batches keep a GPU busy instead of feeding it single pages.
+config = DoclingConverterManagerConfig(
+    artifacts_path=models_path,
+    ocr_batch_size=settings.ocr_batch_size,
+    layout_batch_size=settings.layout_batch_size,
+    table_batch_size=settings.table_batch_size,
+    # Convert this many documents at once, each batch is sized to match
+    doc_batch_size=settings.doc_concurrency,
+    doc_batch_concurrency=settings.doc_concurrency,
+)
 converter = DoclingConverterManager(config)
 
 
-results = []
-result_processor = ResultsProcessor(
-    target_s3_coords=s3_target_coords,
-    to_formats=[v.value for v in convert_options.to_formats],
-    generate_page_images=convert_options.include_images,
-    generate_picture_images=convert_options.include_images,
-)
-for item in result_processor.process_documents(
-    converter.convert_documents(presign_filtered_source_keys, options=convert_options)
-):
-    results.append(item)
-    print(f"Convertion result: {item}")
+# Results are uploaded by the ResultsProcessor as soon as each document is
+# converted; only a per-status tally is kept here so the ConversionResults can
+# be garbage collected right away.
+status_counts: dict[str, int] = {}
+with S3TargetProcessor(s3_target_coords) as target_processor:
+    result_processor = ResultsProcessor(
+        target_processor=target_processor,
+        to_formats=[v.value for v in convert_options.to_formats],
+        generate_page_images=convert_options.include_images,
+        generate_picture_images=convert_options.include_images,
+        bundle_exports=settings.bundle_exports,
+        # Where the converted-output checks above look for the json outputs
+        artifact_root_prefix=get_converted_source_root(s3_coords_source),
+    )
+    for item in result_processor.process_documents(
+        converter.convert_documents(
+            presign_filtered_source_keys, options=convert_options
+        )
+    ):
+        status = item.rsplit(" - ", 1)[-1]
+        status_counts[status] = status_counts.get(status, 0) + 1
+        logging.info("Convertion result: %s", item)
+
+logging.info("Convertion summary: %s", status_counts)
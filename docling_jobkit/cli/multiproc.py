@@ -283,7 +283,7 @@ def process_batch(
     logging.basicConfig(level=log_level, force=True)
     logging.getLogger().setLevel(log_level)
 
-    start_time = time.time()
+    start_time = time.monotonic()
     num_succeeded = 0
     num_failed = 0
     failed_documents: list[str] = []
@@ -343,7 +343,7 @@ def process_batch(
                     if progress_queue:
                         progress_queue.put("document_completed")
 
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
 
         return BatchResult(
             chunk_index=chunk_index,
@@ -355,7 +355,7 @@ def process_batch(
         )
 
     except Exception as e:
-        processing_time = time.time() - start_time
+        processing_time = time.monotonic() - start_time
         _log.error(f"Batch {chunk_index} failed with error: {e}")
         return BatchResult(
             chunk_index=chunk_index,
@@ -465,7 +465,7 @@ def convert(
 
     # Process each source
     all_batch_results: list[BatchResult] = []
-    overall_start_time = time.time()
+    overall_start_time = time.monotonic()
 
     for source_idx, source in enumerate(config.sources):
         batch_results = _process_source(
@@ -484,7 +484,7 @@ def convert(
         )
         all_batch_results.extend(batch_results)
 
-    overall_time = time.time() - overall_start_time
+    overall_time = time.monotonic() - overall_start_time
 
     # Display summary
     _display_summary(all_batch_results, overall_time, quiet)
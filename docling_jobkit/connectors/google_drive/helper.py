@@ -1,5 +1,8 @@
 import json
 import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from io import BytesIO
 from pathlib import Path, PurePosixPath
@@ -7,9 +10,17 @@ from typing import Iterable
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import Resource, build
-from googleapiclient.http import MediaFileUpload, MediaIoBaseDownload, MediaIoBaseUpload
+from googleapiclient.errors import HttpError
+from googleapiclient.http import (
+    HttpRequest,
+    MediaFileUpload,
+    MediaIoBaseDownload,
+    MediaIoBaseUpload,
+    build_http,
+)
 from pydantic import BaseModel
 
 from docling.datamodel.service.sources import GoogleDriveCoordinates
@@ -17,6 +28,19 @@ from docling.datamodel.service.sources import GoogleDriveCoordinates
 from docling_jobkit.connectors.auth_context import is_interactive_auth_allowed
 from docling_jobkit.connectors.errors import ConnectorAuthenticationError
 
+DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+DOWNLOAD_MAX_WORKERS = 8
+
+# Drive accepts single-request (multipart) uploads up to 5 MB, above that the
+# resumable protocol is used with large chunks to keep the request count low.
+SIMPLE_UPLOAD_MAX_SIZE = 5 * 1024 * 1024
+RESUMABLE_UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+
+# Authorized credentials per coordinates, reused by the processors of a worker
+# process instead of refreshing the OAuth token for every one of them.
+_credentials_cache: dict[tuple[str | None, ...], Credentials] = {}
+_credentials_lock = threading.Lock()
+
 
 class GoogleDriveFileIdentifier(BaseModel):
     id: str
@@ -41,17 +65,43 @@ def _get_client_info(coords):
     raise ValueError("Missing client credentials")
 
 
+def _credentials_cache_key(coords: GoogleDriveCoordinates) -> tuple[str | None, ...]:
+    return (
+        coords.token_path,
+        coords.credentials_path,
+        coords.refresh_token,
+        coords.credentials.client_id if coords.credentials else None,
+    )
+
+
+def _get_cached_credentials(coords: GoogleDriveCoordinates) -> Credentials | None:
+    with _credentials_lock:
+        creds = _credentials_cache.get(_credentials_cache_key(coords))
+    if creds is not None and creds.expired and creds.refresh_token:
+        try:
+            creds.refresh(Request())
+        except Exception as e:
+            logging.warning("Cached token refresh failed: %s", e)
+            return None
+    return creds if creds is not None and creds.valid else None
+
+
 def get_service(coords: GoogleDriveCoordinates) -> Resource:
     """
     Return an authorized Google Drive service (googleapiclient.discovery.Resource). Build the service using, in priority:
+      0) Credentials already authorized in this process for the same coordinates,
       1) An already-stored token file,
       2) An already-generated refresh token,
       3) The local OAuth flow.
     """
     SCOPES = ["https://www.googleapis.com/auth/drive"]
-    creds = None
     refresh_error: Exception | None = None
 
+    # 0) Cached credentials
+    creds = _get_cached_credentials(coords)
+    if creds is not None:
+        return build("drive", "v3", credentials=creds, cache_discovery=False)
+
     # 1) Stored token
     if coords.token_path and Path(coords.token_path).exists():
         try:
@@ -106,41 +156,70 @@ def get_service(coords: GoogleDriveCoordinates) -> Resource:
     # Save token
     if coords.token_path:
         Path(coords.token_path).write_text(creds.to_json())
+    with _credentials_lock:
+        _credentials_cache[_credentials_cache_key(coords)] = creds
 
     return build("drive", "v3", credentials=creds, cache_discovery=False)
 
 
-def _yield_children(service: Resource, folder_id: str):
-    """Yield direct children of a folder."""
-
-    query = f"'{folder_id}' in parents and trashed = false"
-    fields = (
-        "nextPageToken, "
-        "files("
-        "id, name, mimeType, modifiedTime, size, parents, "
-        "shortcutDetails(targetId, targetMimeType)"
-        ")"
+_CHILDREN_FIELDS = (
+    "nextPageToken, "
+    "files("
+    "id, name, mimeType, modifiedTime, size, parents, "
+    "shortcutDetails(targetId, targetMimeType)"
+    ")"
+)
+# Drive executes at most 100 calls per batch HTTP request.
+_LIST_BATCH_SIZE = 100
+
+
+def _list_children_request(
+    service: Resource, folder_id: str, page_token: str | None
+) -> HttpRequest:
+    return service.files().list(
+        q=f"'{folder_id}' in parents and trashed = false",
+        spaces="drive",
+        fields=_CHILDREN_FIELDS,
+        pageToken=page_token,
+        pageSize=1000,
+        includeItemsFromAllDrives=True,
+        supportsAllDrives=True,
     )
-    page_token = None
-    while True:
-        resp = (
-            service.files()
-            .list(
-                q=query,
-                spaces="drive",
-                fields=fields,
-                pageToken=page_token,
-                pageSize=1000,
-                includeItemsFromAllDrives=True,
-                supportsAllDrives=True,
+
+
+def _yield_children_batched(service: Resource, folder_ids: list[str]):
+    """
+    Yield (folder_id, child) for the direct children of several folders.
+    Listings are sent as batch HTTP requests, one round-trip per 100 pages.
+    """
+
+    pending: list[tuple[str, str | None]] = [
+        (folder_id, None) for folder_id in folder_ids
+    ]
+    while pending:
+        batch_items = pending[:_LIST_BATCH_SIZE]
+        pending = pending[_LIST_BATCH_SIZE:]
+        responses: dict[str, dict] = {}
+
+        def _collect(request_id, response, exception):
+            if exception is not None:
+                raise exception
+            responses[request_id] = response
+
+        batch = service.new_batch_http_request(callback=_collect)
+        for idx, (folder_id, page_token) in enumerate(batch_items):
+            batch.add(
+                _list_children_request(service, folder_id, page_token),
+                request_id=str(idx),
             )
-            .execute()
-        )
-        for f in resp.get("files", []):
-            yield f
-        page_token = resp.get("nextPageToken")
-        if not page_token:
-            break
+        batch.execute()
+
+        for idx, (folder_id, _page_token) in enumerate(batch_items):
+            resp = responses[str(idx)]
+            for f in resp.get("files", []):
+                yield folder_id, f
+            if resp.get("nextPageToken"):
+                pending.append((folder_id, resp["nextPageToken"]))
 
 
 def _yield_files_infos(
@@ -148,7 +227,7 @@ def _yield_files_infos(
     coords: GoogleDriveCoordinates,
 ) -> Iterable[GoogleDriveFileIdentifier]:
     """
-    Depth-first traversal of Google Drive.
+    Breadth-first traversal of Google Drive, listing each level of folders at once.
     Yields dicts: {id, name, mimeType, path}
     """
 
@@ -173,13 +252,13 @@ def _yield_files_infos(
         )
         return
 
-    stack = [(coords.path_id, root_meta["name"])]
-    while stack:
-        cur_id, cur_path = stack.pop()
-        for item in _yield_children(service, cur_id):
-            path = f"{cur_path}/{item['name']}"
+    frontier = {coords.path_id: root_meta["name"]}
+    while frontier:
+        next_frontier: dict[str, str] = {}
+        for parent_id, item in _yield_children_batched(service, list(frontier)):
+            path = f"{frontier[parent_id]}/{item['name']}"
             if item["mimeType"] == "application/vnd.google-apps.folder":
-                stack.append((item["id"], path))
+                next_frontier[item["id"]] = path
             else:
                 yield GoogleDriveFileIdentifier(
                     id=item["id"],
@@ -189,6 +268,7 @@ def _yield_files_infos(
                     size=item.get("size"),
                     last_modified=item.get("modifiedTime"),
                 )
+        frontier = next_frontier
 
 
 def get_source_files_infos(
@@ -227,6 +307,12 @@ def download_file(
     else:
         request = service.files().get_media(fileId=file_info.id, supportsAllDrives=True)
 
+    if file_info.size is not None and file_info.size > DOWNLOAD_CHUNK_SIZE:
+        credentials = getattr(request.http, "credentials", None)
+        if credentials is not None:
+            _download_ranges(request, credentials, file_info.size, file_stream)
+            return
+
     downloader = MediaIoBaseDownload(file_stream, request)
     done = False
     while not done:
@@ -235,6 +321,42 @@ def download_file(
             logging.info("Downloading: %d%%", int(status.progress() * 100))
 
 
+def _authorized_http(credentials) -> AuthorizedHttp:
+    return AuthorizedHttp(credentials, http=build_http())
+
+
+def _download_ranges(
+    request: HttpRequest,
+    credentials,
+    file_size: int,
+    file_stream: BytesIO,
+) -> None:
+    """
+    Download a binary file of known size as concurrent range requests.
+    httplib2 connections are not thread-safe, so every worker gets its own.
+    """
+    local = threading.local()
+
+    def _fetch(start: int) -> bytes:
+        http = getattr(local, "http", None)
+        if http is None:
+            http = local.http = _authorized_http(credentials)
+        end = min(start + DOWNLOAD_CHUNK_SIZE, file_size) - 1
+        headers = {**request.headers, "range": f"bytes={start}-{end}"}
+        resp, content = http.request(request.uri, "GET", headers=headers)
+        if resp.status != 206 or len(content) != end - start + 1:
+            raise HttpError(resp, content, uri=request.uri)
+        return content
+
+    offsets = range(0, file_size, DOWNLOAD_CHUNK_SIZE)
+    with ThreadPoolExecutor(
+        max_workers=min(DOWNLOAD_MAX_WORKERS, len(offsets))
+    ) as executor:
+        for done, content in enumerate(executor.map(_fetch, offsets), start=1):
+            file_stream.write(content)
+            logging.info("Downloading: %d%%", int(done / len(offsets) * 100))
+
+
 def _create_subfolders(service, base_folder_id: str, target_path_parent: str) -> str:
     """
     Create subfolders in "target_path_parent". For instance, if "target_path_parent" is "pages/abc.png", the folder "pages" is created in Google Drive.
@@ -281,6 +403,18 @@ def _create_subfolders(service, base_folder_id: str, target_path_parent: str) ->
     return deepest_folder_id
 
 
+def _upload_size(filename, file_stream) -> int | None:
+    if file_stream is None:
+        return os.path.getsize(filename)
+    try:
+        position = file_stream.tell()
+        size = file_stream.seek(0, os.SEEK_END) - position
+        file_stream.seek(position)
+    except (AttributeError, OSError):
+        return None
+    return size
+
+
 def upload_file(
     service,
     target_filename: str,
@@ -311,15 +445,22 @@ def upload_file(
     else:
         parent_id = coords.path_id
 
-    # Upload file
-    chunk_size = 8 * 1024 * 1024
+    # Upload file, small files in one request instead of opening an upload session
+    size = _upload_size(filename, file_stream)
+    resumable = size is None or size > SIMPLE_UPLOAD_MAX_SIZE
     if file_stream is not None:
         media = MediaIoBaseUpload(
-            file_stream, mimetype=content_type, chunksize=chunk_size, resumable=True
+            file_stream,
+            mimetype=content_type,
+            chunksize=RESUMABLE_UPLOAD_CHUNK_SIZE,
+            resumable=resumable,
         )
     else:
         media = MediaFileUpload(
-            filename, mimetype=content_type, chunksize=chunk_size, resumable=True
+            filename,
+            mimetype=content_type,
+            chunksize=RESUMABLE_UPLOAD_CHUNK_SIZE,
+            resumable=resumable,
         )
     request = service.files().create(
         body={"name": target_path.name, "parents": [parent_id]},
@@ -327,7 +468,7 @@ def upload_file(
         fields="id, name, webViewLink",
         supportsAllDrives=True,
     )
-    response = None
+    response = None if resumable else request.execute()
     while response is None:
         status, response = request.next_chunk()
         if status:
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
 import logging
-from pathlib import Path
-from typing import TYPE_CHECKING
+import posixpath
+import threading
+import warnings
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from typing import TYPE_CHECKING, Collection, Iterable, Iterator, Mapping
 from urllib.parse import urlunsplit
 
+from boto3.s3.transfer import TransferConfig
 from boto3.session import Session
 from botocore.config import Config
 from botocore.exceptions import (
@@ -21,7 +29,9 @@ if TYPE_CHECKING:
     from mypy_boto3_s3.paginator import ListObjectsV2Paginator
     from mypy_boto3_s3.service_resource import S3ServiceResource
 
+from docling.datamodel.base_models import FormatToExtensions, InputFormat
 from docling.datamodel.service.sources import S3Coordinates
+from docling_core.types.io import DocumentStream
 
 from docling_jobkit.connectors.artifact_paths import hash_path_component
 
@@ -62,30 +72,84 @@ def is_s3_unavailable_error(exc: BaseException) -> bool:
     return isinstance(exc, BotoCoreError)
 
 
-def get_s3_connection(coords: S3Coordinates):
-    session = Session()
+# Attempts per S3 call, the first one included. Kept low so that a wrong or
+# unreachable endpoint fails within about S3_MAX_ATTEMPTS * S3_CONNECT_TIMEOUT_S;
+# raise it (before clients are created) for heavily throttled bulk transfers.
+S3_MAX_ATTEMPTS = 2
+S3_CONNECT_TIMEOUT_S = 10
+
 
-    config = Config(
-        connect_timeout=30,
+def _s3_config() -> Config:
+    return Config(
+        connect_timeout=S3_CONNECT_TIMEOUT_S,
         read_timeout=60,  # cap stalled-read hangs; applies to list, get, and put responses
-        retries={"max_attempts": 1},
+        # adaptive mode backs off on throttling (SlowDown) and transient errors,
+        # which concurrent transfers hit much sooner than sequential ones, and
+        # also rate-limits the client's requests while throttling persists
+        retries={"max_attempts": S3_MAX_ATTEMPTS, "mode": "adaptive"},
         signature_version="s3v4",
+        # concurrent uploads (8) each run multipart transfers with up to 4 threads,
+        # keep headroom above that for listing, presigning and prefetching
+        max_pool_connections=64,
+        tcp_keepalive=True,
     )
+
+
+# Large objects are fetched with concurrent ranged GETs over the pooled
+# connections, small ones (the common case) keep a single GET.
+S3_DOWNLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+
+def _s3_endpoint_url(coords: S3Coordinates) -> str:
     scheme = "https" if coords.verify_ssl else "http"
     path = "/"
-    endpoint = urlunsplit((scheme, coords.endpoint, path, "", ""))
+    return urlunsplit((scheme, coords.endpoint, path, "", ""))
 
-    client: S3Client = session.client(
-        "s3",
-        endpoint_url=endpoint,
+
+_session: Session | None = None
+_session_lock = threading.Lock()
+
+
+def _create_from_shared_session(method: str, **kwargs):
+    # A new Session parses the S3 service and resource models again (~100 ms per
+    # client); sharing one per process keeps them loaded across tasks. Sessions
+    # are not thread-safe, so creation is serialized; the clients themselves are.
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = Session()
+        return getattr(_session, method)("s3", **kwargs)
+
+
+def create_s3_client(coords: S3Coordinates) -> S3Client:
+    """Return a new client owned (and closed) by the caller.
+
+    Prefer this over ``get_s3_connection`` when no resource is needed, building
+    the resource costs several times more than the client itself.
+    """
+    return _create_from_shared_session(
+        "client",
+        endpoint_url=_s3_endpoint_url(coords),
         verify=coords.verify_ssl,
         aws_access_key_id=coords.access_key,
         aws_secret_access_key=coords.secret_key,
-        config=config,
+        config=_s3_config(),
     )
 
-    resource: S3ServiceResource = session.resource(
-        "s3",
+
+def get_s3_connection(coords: S3Coordinates):
+    config = _s3_config()
+    endpoint = _s3_endpoint_url(coords)
+
+    client = create_s3_client(coords)
+
+    resource: S3ServiceResource = _create_from_shared_session(
+        "resource",
         endpoint_url=endpoint,
         verify=coords.verify_ssl,
         aws_access_key_id=coords.access_key,
@@ -96,51 +160,170 @@ def get_s3_connection(coords: S3Coordinates):
     return client, resource
 
 
+@lru_cache(maxsize=8)
+def _get_shared_s3_client(
+    endpoint: str,
+    verify_ssl: bool,
+    access_key: str | None,
+    secret_key: str | None,
+) -> S3Client:
+    return _create_from_shared_session(
+        "client",
+        endpoint_url=endpoint,
+        verify=verify_ssl,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        config=_s3_config(),
+    )
+
+
+def get_s3_client(coords: S3Coordinates) -> S3Client:
+    """Return a client shared by all callers using the same endpoint and credentials.
+
+    Creating a boto3 client loads the service model, which is noticeably slow
+    when done per call. The returned client is thread-safe but must not be
+    closed by the caller; use ``get_s3_connection`` for a private client.
+    """
+    return _get_shared_s3_client(
+        _s3_endpoint_url(coords),
+        coords.verify_ssl,
+        coords.access_key,
+        coords.secret_key,
+    )
+
+
 def count_s3_objects(paginator: ListObjectsV2Paginator, bucket_name: str, prefix: str):
     response_iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
-    count_obj = 0
-    for page in response_iterator:
-        if page.get("Contents"):
-            count_obj += sum(1 for _ in page["Contents"])
+    # Some S3-compatible stores omit KeyCount, fall back to the page contents
+    return sum(
+        page.get("KeyCount", len(page.get("Contents", [])))
+        for page in response_iterator
+    )
+
+
+def iter_s3_keys(s3_client: S3Client, bucket_name: str, prefix: str) -> Iterator[str]:
+    """Yield the keys below ``prefix`` page by page, as the listing arrives.
 
-    return count_obj
+    Only the keys are needed, building an ObjectSummary per object through a
+    resource would be wasted work.
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+        for obj in page.get("Contents", []):
+            yield obj["Key"]
+
+
+def list_s3_keys(s3_client: S3Client, bucket_name: str, prefix: str) -> set[str]:
+    return set(iter_s3_keys(s3_client, bucket_name, prefix))
 
 
 def get_keys_s3_objects_as_set(
     s3_resource: S3ServiceResource, bucket_name: str, prefix: str
 ) -> set[str]:
-    bucket = s3_resource.Bucket(bucket_name)
-    folder_objects = list(bucket.objects.filter(Prefix=prefix))
-    files_on_s3 = set()
-    for file in folder_objects:
-        files_on_s3.add(file.key)
-    return files_on_s3
+    return list_s3_keys(s3_resource.meta.client, bucket_name, prefix)
+
+
+def get_s3_objects_last_modified(
+    s3_client: S3Client, bucket_name: str, prefix: str
+) -> dict[str, datetime]:
+    # LastModified is part of every listing entry, no HEAD request is needed.
+    paginator = s3_client.get_paginator("list_objects_v2")
+    return {
+        obj["Key"]: obj["LastModified"]
+        for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+        for obj in page.get("Contents", [])
+    }
+
+
+def list_s3_keys_parallel(
+    s3_client: S3Client,
+    bucket_name: str,
+    prefix: str,
+    max_workers: int = 4,
+) -> set[str]:
+    """List the keys below ``prefix``, fanning out one listing per sub-prefix.
+
+    The top level is listed once with ``Delimiter="/"`` to discover the common
+    prefixes, which are then walked concurrently. Only the client is shared
+    across threads, boto3 resources are not thread-safe.
+    """
+    paginator = s3_client.get_paginator("list_objects_v2")
+    keys: set[str] = set()
+    sub_prefixes: list[str] = []
+    for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix, Delimiter="/"):
+        keys.update(obj["Key"] for obj in page.get("Contents", []))
+        sub_prefixes.extend(cp["Prefix"] for cp in page.get("CommonPrefixes", []))
+
+    def _list_sub_prefix(sub_prefix: str) -> list[str]:
+        sub_paginator = s3_client.get_paginator("list_objects_v2")
+        return [
+            obj["Key"]
+            for page in sub_paginator.paginate(Bucket=bucket_name, Prefix=sub_prefix)
+            for obj in page.get("Contents", [])
+        ]
+
+    if sub_prefixes:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for sub_keys in executor.map(_list_sub_prefix, sub_prefixes):
+                keys.update(sub_keys)
+    return keys
+
+
+def list_s3_keys_sharded(
+    s3_client: S3Client,
+    bucket_name: str,
+    prefix: str,
+    shard_chars: str = "0123456789abcdef",
+    max_workers: int = 16,
+) -> set[str]:
+    """List the keys below ``prefix`` as concurrent key ranges.
+
+    Each character of ``shard_chars`` marks a range boundary (``prefix + char``).
+    Every shard starts after its lower boundary with ``StartAfter`` and stops
+    once the keys pass the next one, so together the shards cover all keys
+    whatever characters they start with. This helps flat prefixes, where
+    ``list_s3_keys_parallel`` finds no sub-prefixes to fan out on.
+    """
+    boundaries = [prefix + char for char in sorted(set(shard_chars))]
+    shards = list(zip([None, *boundaries], [*boundaries, None]))
+
+    def _list_shard(shard: tuple[str | None, str | None]) -> list[str]:
+        start_after, stop = shard
+        paginator = s3_client.get_paginator("list_objects_v2")
+        kwargs = {"Bucket": bucket_name, "Prefix": prefix}
+        if start_after is not None:
+            kwargs["StartAfter"] = start_after
+        keys: list[str] = []
+        for page in paginator.paginate(**kwargs):  # type: ignore[arg-type]
+            for obj in page.get("Contents", []):
+                # S3 returns keys in UTF-8 binary order, which matches str order
+                if stop is not None and obj["Key"] > stop:
+                    return keys
+                keys.append(obj["Key"])
+        return keys
+
+    keys: set[str] = set()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for shard_keys in executor.map(_list_shard, shards):
+            keys.update(shard_keys)
+    return keys
 
 
 def strip_prefix_postfix(source_set: set[str], prefix: str = "", extension: str = ""):
-    output = set()
-    for key in source_set:
-        output.add(key.replace(extension, "").replace(prefix, ""))
-    return output
+    if not prefix and not extension:
+        return set(source_set)
+    # Only strip at the ends, a prefix or extension repeated inside the key stays
+    return {key.removeprefix(prefix).removesuffix(extension) for key in source_set}
 
 
 def generate_batch_keys(
     source_keys: list[str],
     batch_size: int = 10,
 ):
-    batched_keys = []
-    counter = 0
-    sub_array = []
-    array_lenght = len(source_keys)
-    for idx, key in enumerate(source_keys):
-        sub_array.append(key)
-        counter += 1
-        if counter == batch_size or (idx + 1) == array_lenght:
-            batched_keys.append(sub_array)
-            sub_array = []
-            counter = 0
-
-    return batched_keys
+    return [
+        source_keys[start : start + batch_size]
+        for start in range(0, len(source_keys), batch_size)
+    ]
 
 
 # TODO: raised default expiration_time raised due to presign being generated
@@ -162,13 +345,82 @@ def generate_presign_url(
         return None
 
 
-def get_source_files(
-    s3_source_client: S3Client,
-    s3_source_resource: S3ServiceResource,
-    s3_coords: S3Coordinates,
-):
-    source_paginator = s3_source_client.get_paginator("list_objects_v2")
+def generate_presign_urls(
+    client: S3Client,
+    object_keys: Iterable[str],
+    bucket: str,
+    expiration_time: int = 21600,
+    max_workers: int = 4,
+) -> Iterator[str]:
+    """Presign ``object_keys`` concurrently, yielding the URLs in key order.
+
+    Keys whose presigning failed are skipped (the error is logged by
+    ``generate_presign_url``).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for url in executor.map(
+            lambda key: generate_presign_url(client, key, bucket, expiration_time),
+            object_keys,
+        ):
+            if url is not None:
+                yield url
+
+
+def prefetch_s3_objects(
+    client: S3Client,
+    object_keys: Iterable[str],
+    bucket: str,
+    max_workers: int = 4,
+    max_buffered_bytes: int = 16 * 1024 * 1024,
+) -> Iterator[DocumentStream]:
+    """Download ``object_keys`` ahead of the consumer, yielding them in key order.
+
+    Up to ``2 * max_workers`` downloads are kept in flight, and no new download
+    is started while the objects already fetched but not yet consumed exceed
+    ``max_buffered_bytes``. Objects which fail to download are logged and
+    skipped.
+    """
+
+    def _download(key: str) -> DocumentStream:
+        buffer = BytesIO()
+        client.download_fileobj(
+            Bucket=bucket,
+            Key=key,
+            Fileobj=buffer,
+            Config=S3_DOWNLOAD_TRANSFER_CONFIG,
+        )
+        buffer.seek(0)
+        return DocumentStream(name=key, stream=buffer)
+
+    pending: deque[tuple[str, Future[DocumentStream]]] = deque()
+
+    def _buffered_bytes() -> int:
+        return sum(
+            fut.result().stream.getbuffer().nbytes
+            for _, fut in pending
+            if fut.done() and fut.exception() is None
+        )
 
+    def _pop() -> Iterator[DocumentStream]:
+        key, fut = pending.popleft()
+        try:
+            yield fut.result()
+        except Exception as e:
+            logging.error(f"Download of s3://{bucket}/{key} failed", exc_info=e)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for key in object_keys:
+            while pending and (
+                len(pending) >= 2 * max_workers
+                or _buffered_bytes() >= max_buffered_bytes
+            ):
+                yield from _pop()
+            pending.append((key, executor.submit(_download, key)))
+        while pending:
+            yield from _pop()
+
+
+def get_source_key_prefix(s3_coords: S3Coordinates) -> str:
     key_prefix = (
         s3_coords.key_prefix
         if s3_coords.key_prefix.endswith("/")
@@ -176,22 +428,63 @@ def get_source_files(
     )
     if key_prefix == "/":
         key_prefix = ""
-    # Check that source is not empty
-    source_count = count_s3_objects(source_paginator, s3_coords.bucket, key_prefix)
-    if source_count == 0:
+    return key_prefix
+
+
+def list_source_files(
+    s3_source_client: S3Client,
+    s3_coords: S3Coordinates,
+    *,
+    max_workers: int | None = None,
+    shard_chars: str | None = None,
+) -> set[str]:
+    key_prefix = get_source_key_prefix(s3_coords)
+    if shard_chars:
+        keys = list_s3_keys_sharded(
+            s3_source_client,
+            s3_coords.bucket,
+            key_prefix,
+            shard_chars=shard_chars,
+            max_workers=max_workers or 16,
+        )
+    elif max_workers is not None and max_workers > 1:
+        keys = list_s3_keys_parallel(
+            s3_source_client, s3_coords.bucket, key_prefix, max_workers=max_workers
+        )
+    else:
+        keys = list_s3_keys(s3_source_client, s3_coords.bucket, key_prefix)
+    # The listing itself tells whether the source is empty, no separate count
+    if not keys:
         logging.error("No documents to process in the source s3 coordinates.")
-    return get_keys_s3_objects_as_set(s3_source_resource, s3_coords.bucket, key_prefix)
+    return keys
 
 
-def check_target_has_source_converted(
-    coords: S3Coordinates,
-    source_objects_list: list[str],
-    source_coords: S3Coordinates,
-):
-    s3_target_client, s3_target_resource = get_s3_connection(coords)
-    target_paginator = s3_target_client.get_paginator("list_objects_v2")
+def get_source_files(
+    s3_source_client: S3Client,
+    s3_source_resource: S3ServiceResource,
+    s3_coords: S3Coordinates,
+) -> set[str]:
+    warnings.warn(
+        "get_source_files() is deprecated; use list_source_files()",
+        DeprecationWarning,
+        stacklevel=2,
+    )
+    return list_source_files(s3_source_client, s3_coords)
+
+
+def _key_stem(key: str) -> str:
+    # Same result as Path(key).stem for object keys, without building a Path
+    # per key; this runs once per source and per target object.
+    return posixpath.splitext(posixpath.basename(key.rstrip("/")))[0]
 
-    source_key = hash_path_component(
+
+def get_converted_source_root(source_coords: S3Coordinates) -> str:
+    """Return the target folder holding the outputs converted from ``source_coords``.
+
+    Pass it as ``artifact_root_prefix`` to the ``ResultsProcessor`` so the
+    outputs land where ``check_target_has_source_converted`` looks for them.
+    """
+    return hash_path_component(
         "|".join(
             [
                 source_coords.endpoint.strip(),
@@ -200,40 +493,205 @@ def check_target_has_source_converted(
             ]
         )
     )
+
+
+def _converted_json_prefix(coords: S3Coordinates, source_coords: S3Coordinates) -> str:
+    source_key = get_converted_source_root(source_coords)
     key_prefix = coords.key_prefix.strip("/")
-    converted_prefix = (
-        f"{key_prefix}/{source_key}/json/" if key_prefix else f"{source_key}/json/"
-    )
+    return f"{key_prefix}/{source_key}/json/" if key_prefix else f"{source_key}/json/"
 
-    target_count = count_s3_objects(target_paginator, coords.bucket, converted_prefix)
-    logging.debug("Target contains json objects: {}".format(target_count))
-    if target_count != 0:
-        logging.debug("Target contains objects, checking content...")
 
-        # Collect target keys for iterative conversion
-        existing_target_objects = get_keys_s3_objects_as_set(
-            s3_target_resource, coords.bucket, converted_prefix
+def get_converted_target_stems(
+    coords: S3Coordinates,
+    source_coords: S3Coordinates,
+) -> dict[str, datetime | None]:
+    """Return the stems of the JSON outputs already written for ``source_coords``.
+
+    The converted prefix is swept once with the paginator; membership is then
+    checked locally instead of issuing one request per source key. Each stem
+    maps to the time its output was last written, when the store reports it.
+    """
+    s3_target_client = get_s3_client(coords)
+    target_paginator = s3_target_client.get_paginator("list_objects_v2")
+    converted_prefix = _converted_json_prefix(coords, source_coords)
+
+    # At this point we should be targeting keys in the json "folder"
+    existing_target_stems: dict[str, datetime | None] = {}
+    for page in target_paginator.paginate(
+        Bucket=coords.bucket, Prefix=converted_prefix
+    ):
+        for obj in page.get("Contents", []):
+            stem = _key_stem(obj["Key"])
+            converted_at = obj.get("LastModified")
+            previous = existing_target_stems.get(stem)
+            if previous is None or (
+                converted_at is not None and converted_at > previous
+            ):
+                existing_target_stems[stem] = converted_at
+    logging.debug("Target contains json objects: {}".format(len(existing_target_stems)))
+    return existing_target_stems
+
+
+def head_converted_target_stems(
+    coords: S3Coordinates,
+    source_coords: S3Coordinates,
+    source_objects_list: Iterable[str],
+    max_workers: int = 64,
+    outputs_named_by_key: bool = False,
+) -> dict[str, datetime | None]:
+    """Like ``get_converted_target_stems``, but only for the given source keys.
+
+    Each expected JSON output is looked up with a HEAD request instead of
+    sweeping the whole converted prefix, which pays off when few sources are
+    checked against a large target. The ``ResultsProcessor`` names the output
+    after the converted document: sources handed over as presigned urls give
+    ``json/<stem>.json``, while streams named by their full key (as from
+    ``prefetch_s3_objects``) give ``json/<key without extension>.json``; set
+    ``outputs_named_by_key`` for the latter.
+    """
+    s3_target_client = get_s3_client(coords)
+    converted_prefix = _converted_json_prefix(coords, source_coords)
+
+    def _head(output_name: str) -> datetime | None:
+        try:
+            response = s3_target_client.head_object(
+                Bucket=coords.bucket, Key=f"{converted_prefix}{output_name}.json"
+            )
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            raise
+        return response["LastModified"]
+
+    def _output_name(key: str) -> str:
+        # Same as the ResultsProcessor's os.path.splitext of the input file name
+        return posixpath.splitext(key)[0] if outputs_named_by_key else _key_stem(key)
+
+    # Output name -> stem the source keys are filtered on
+    output_stems = {_output_name(key): _key_stem(key) for key in source_objects_list}
+    existing_target_stems: dict[str, datetime | None] = {}
+    if not output_stems:
+        return existing_target_stems
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(output_stems))
+    ) as executor:
+        for stem, converted_at in zip(
+            output_stems.values(), executor.map(_head, output_stems)
+        ):
+            if converted_at is not None:
+                existing_target_stems[stem] = converted_at
+    logging.debug("Target contains json objects: {}".format(len(existing_target_stems)))
+    return existing_target_stems
+
+
+def iter_unconverted_source_keys(
+    source_keys: Iterable[str],
+    existing_target_stems: Collection[str],
+    source_last_modified: Mapping[str, datetime] | None = None,
+) -> Iterator[str]:
+    """Lazily drop the source keys whose output already exists in the target.
+
+    Only the target stems are held in memory, the source keys can be streamed
+    straight from ``iter_s3_keys``. When ``source_last_modified`` is given and
+    ``existing_target_stems`` maps stems to their conversion time, a source
+    modified after its output was written is kept, so updated documents are
+    converted again.
+    """
+    if not existing_target_stems:
+        yield from source_keys
+        return
+
+    converted_times = (
+        existing_target_stems if isinstance(existing_target_stems, Mapping) else None
+    )
+    # This covers the case when source docs have "folder" hierarchy in the key
+    # we don't preserve key part between prefix and "file", this part of key is not added as prefix for target
+    for key in source_keys:
+        stem = _key_stem(key)
+        if stem not in existing_target_stems:
+            yield key
+            continue
+        if source_last_modified is None or converted_times is None:
+            continue
+        converted_at = converted_times[stem]
+        modified_at = source_last_modified.get(key)
+        if (
+            converted_at is not None
+            and modified_at is not None
+            and modified_at > converted_at
+        ):
+            yield key
+
+
+def filter_converted_source_keys(
+    source_objects_list: list[str],
+    existing_target_stems: Collection[str],
+    source_last_modified: Mapping[str, datetime] | None = None,
+) -> list[str]:
+    """Drop the source keys whose output already exists in the target.
+
+    See ``iter_unconverted_source_keys``, which this collects into a list.
+    """
+    filtered_source_keys = list(
+        iter_unconverted_source_keys(
+            source_objects_list, existing_target_stems, source_last_modified
         )
+    )
 
-        # At this point we should be targeting keys in the json "folder"
-        target_short_key_list = []
-        for item in existing_target_objects:
-            clean_name = str(Path(item).stem)
-            target_short_key_list.append(clean_name)
-
-        filtered_source_keys = []
-        logging.debug("List of source keys:")
-        for key in source_objects_list:
-            logging.debug("Object key: {}".format(key))
-            # This covers the case when source docs have "folder" hierarchy in the key
-            # we don't preserve key part between prefix and "file", this part of key is not added as prefix for target
-            clean_key = str(Path(key).stem)
-            if clean_key not in target_short_key_list:
-                filtered_source_keys.append(key)
-
-        logging.debug("Total keys: {}".format(len(source_objects_list)))
-        logging.debug("Filtered keys to process: {}".format(len(filtered_source_keys)))
-    else:
-        filtered_source_keys = source_objects_list
+    logging.debug("Total keys: {}".format(len(source_objects_list)))
+    logging.debug("Filtered keys to process: {}".format(len(filtered_source_keys)))
 
     return filtered_source_keys
+
+
+def filter_source_keys_by_format(
+    source_objects_list: Iterable[str],
+    formats: Iterable[InputFormat],
+) -> list[str]:
+    """Keep the source keys whose extension belongs to one of ``formats``.
+
+    Other objects would be presigned or downloaded only for docling to reject
+    them, so they are dropped before any request is made for them.
+    """
+    extensions = {
+        extension.lower() for fmt in formats for extension in FormatToExtensions[fmt]
+    }
+    # The last suffix is looked up in a set, only the few compound extensions
+    # (e.g. tar.gz) need the slower endswith scan.
+    simple_extensions = frozenset(ext for ext in extensions if "." not in ext)
+    compound_suffixes = tuple(f".{ext}" for ext in extensions if "." in ext)
+
+    def _has_extension(key: str) -> bool:
+        _stem, dot, extension = key.rpartition(".")
+        if not dot:
+            return False
+        if extension.lower() in simple_extensions:
+            return True
+        return bool(compound_suffixes) and key.lower().endswith(compound_suffixes)
+
+    return [key for key in source_objects_list if _has_extension(key)]
+
+
+def check_target_has_source_converted(
+    coords: S3Coordinates,
+    source_objects_list: list[str],
+    source_coords: S3Coordinates,
+    source_last_modified: Mapping[str, datetime] | None = None,
+    head_lookups: bool = False,
+    outputs_named_by_key: bool = False,
+):
+    existing_target_stems = (
+        head_converted_target_stems(
+            coords,
+            source_coords,
+            source_objects_list,
+            outputs_named_by_key=outputs_named_by_key,
+        )
+        if head_lookups
+        else get_converted_target_stems(coords, source_coords)
+    )
+    return filter_converted_source_keys(
+        source_objects_list,
+        existing_target_stems,
+        source_last_modified,
+    )
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import get_args
 
 from pydantic import BaseModel
 
@@ -25,6 +26,10 @@ from docling_jobkit.datamodel.source_identity import SourceIdentity
 from docling_jobkit.datamodel.task import Task
 
 _METADATA_FIELDS = ("tenant_id", "user_id", "project_id")
+_ARTIFACT_TYPE_ORDER = {
+    artifact_type: position
+    for position, artifact_type in enumerate(get_args(ArtifactType))
+}
 
 
 class S3PresignedTargetProcessor(S3TargetProcessor):
@@ -72,6 +77,7 @@ class S3PresignedTargetProcessor(S3TargetProcessor):
             filename=path,
             content_type=mime_type,
             metadata=metadata,
+            transfer_manager=self._transfer_manager,
         )
         self._uploaded_artifacts.setdefault(source.source_index, []).append(
             (artifact_type, mime_type, object_key)
@@ -87,7 +93,12 @@ class S3PresignedTargetProcessor(S3TargetProcessor):
         timings: dict[str, ProfilingItem],
         confidence: ConfidenceScores | None = None,
     ) -> DocumentArtifactItem:
-        uploaded = self._uploaded_artifacts.get(source.source_index, [])
+        # Uploads may complete in any order when they run concurrently, list
+        # the artifacts by type and key so the response does not depend on it.
+        uploaded = sorted(
+            self._uploaded_artifacts.get(source.source_index, []),
+            key=lambda item: (_ARTIFACT_TYPE_ORDER[item[0]], item[2]),
+        )
         expires_at = datetime.now(timezone.utc) + timedelta(
             seconds=self._config.url_expiration
         )
@@ -13,7 +13,8 @@ from docling_core.types.io import DocumentStream
 
 from docling_jobkit.connectors.errors import map_connector_authentication_errors
 from docling_jobkit.connectors.s3.helper import (
-    get_s3_connection,
+    S3_DOWNLOAD_TRANSFER_CONFIG,
+    create_s3_client,
     is_s3_authentication_error,
     is_s3_unavailable_error,
 )
@@ -55,7 +56,7 @@ class S3SourceProcessor(BaseSourceProcessor[S3Coordinates, S3FileIdentifier]):
 
     @_map_s3_source_errors
     def _initialize(self):
-        self._client, self._resource = get_s3_connection(self._coords)
+        self._client = create_s3_client(self._coords)
 
     def _finalize(self):
         self._client.close()
@@ -133,7 +134,10 @@ class S3SourceProcessor(BaseSourceProcessor[S3Coordinates, S3FileIdentifier]):
         buffer = BytesIO()
         try:
             self._client.download_fileobj(
-                Bucket=self._coords.bucket, Key=identifier.key, Fileobj=buffer
+                Bucket=self._coords.bucket,
+                Key=identifier.key,
+                Fileobj=buffer,
+                Config=S3_DOWNLOAD_TRANSFER_CONFIG,
             )
         except ClientError:
             _log.warning(
@@ -8,10 +8,12 @@ from docling.datamodel.service.targets import S3Target
 
 from docling_jobkit.connectors.errors import map_connector_authentication_errors
 from docling_jobkit.connectors.s3.helper import (
-    get_s3_connection,
+    create_s3_client,
     is_s3_authentication_error,
 )
 from docling_jobkit.connectors.s3.upload_support import (
+    S3TransferManager,
+    create_s3_transfer_manager,
     upload_s3_file,
     upload_s3_object,
 )
@@ -22,16 +24,27 @@ class S3TargetProcessor(BaseTargetProcessor):
     def __init__(self, coords: S3Coordinates):
         super().__init__()
         self._coords = coords
+        self._transfer_manager: S3TransferManager | None = None
 
     @classmethod
     def get_config_types(cls) -> tuple[type[BaseModel], ...]:
         return (S3Target,)
 
+    @classmethod
+    def max_concurrent_uploads(cls) -> int:
+        # boto3 clients are thread-safe; stay below the client's connection pool
+        return 8
+
     @map_connector_authentication_errors("S3", is_s3_authentication_error)
     def _initialize(self):
-        self._client, self._resource = get_s3_connection(self._coords)
+        self._client = create_s3_client(self._coords)
+        self._transfer_manager = create_s3_transfer_manager(
+            self._client, self.max_concurrent_uploads()
+        )
 
     def _finalize(self):
+        if self._transfer_manager is not None:
+            self._transfer_manager.shutdown()
         self._client.close()
 
     def _build_full_key(self, target_filename: str) -> str:
@@ -61,6 +74,7 @@ class S3TargetProcessor(BaseTargetProcessor):
             key=full_key,
             filename=filename,
             content_type=content_type,
+            transfer_manager=self._transfer_manager,
         )
 
     @map_connector_authentication_errors("S3", is_s3_authentication_error)
@@ -80,4 +94,5 @@ class S3TargetProcessor(BaseTargetProcessor):
             key=full_key,
             obj=obj,
             content_type=content_type,
+            transfer_manager=self._transfer_manager,
         )
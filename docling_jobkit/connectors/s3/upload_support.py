@@ -1,14 +1,66 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import BinaryIO
+from typing import Any, BinaryIO, Protocol
+
+from boto3.s3.transfer import TransferConfig, create_transfer_manager
 
 from docling_jobkit.config.target_config import S3PresignedConfig
 from docling_jobkit.connectors.artifact_paths import hash_path_component
 from docling_jobkit.datamodel.task import Task
 
+# Exports above 8 MiB are sent as concurrent multipart parts, smaller bodies keep
+# a single PUT. Part concurrency is kept low since S3TargetProcessor already
+# runs several uploads at once: 8 uploads x 4 parts stay well within the 64
+# pooled connections of the client instead of overflowing the pool.
+S3_UPLOAD_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+    use_threads=True,
+)
+
+
+class S3TransferManager(Protocol):
+    """The part of the manager from ``boto3.s3.transfer.create_transfer_manager``
+    used for uploads, so the s3transfer internals stay out of our signatures."""
+
+    def upload(
+        self,
+        fileobj: Any,
+        bucket: str,
+        key: str,
+        extra_args: dict[str, Any] | None = None,
+    ) -> Any: ...
+
+    def shutdown(self) -> None: ...
+
+
+def create_s3_transfer_manager(
+    client, max_concurrent_uploads: int
+) -> S3TransferManager:
+    """Return a transfer manager to reuse for all the uploads of ``client``.
+
+    ``client.upload_file`` and ``upload_fileobj`` start and shut down a
+    transfer manager with its own thread pools on every call, which costs
+    more than sending a small export. A shared manager serves all concurrent
+    uploads from one pool, sized for ``max_concurrent_uploads`` transfers of
+    ``S3_UPLOAD_TRANSFER_CONFIG`` each.
+    """
+    config = TransferConfig(
+        multipart_threshold=S3_UPLOAD_TRANSFER_CONFIG.multipart_threshold,
+        multipart_chunksize=S3_UPLOAD_TRANSFER_CONFIG.multipart_chunksize,
+        max_concurrency=(
+            max_concurrent_uploads * S3_UPLOAD_TRANSFER_CONFIG.max_request_concurrency
+        ),
+        use_threads=True,
+    )
+    config.max_submission_concurrency = max_concurrent_uploads
+    return create_transfer_manager(client, config)
+
 
 def upload_s3_file(
     client,
@@ -18,16 +70,23 @@ def upload_s3_file(
     filename: str | Path,
     content_type: str,
     metadata: dict[str, str] | None = None,
+    transfer_manager: S3TransferManager | None = None,
 ) -> None:
     extra_args = _build_extra_args(
         content_type=content_type,
         metadata=metadata,
     )
+    if transfer_manager is not None:
+        transfer_manager.upload(
+            os.fspath(filename), bucket, key, extra_args=extra_args
+        ).result()
+        return
     client.upload_file(
         Filename=filename,
         Bucket=bucket,
         Key=key,
         ExtraArgs=extra_args,
+        Config=S3_UPLOAD_TRANSFER_CONFIG,
     )
 
 
@@ -39,6 +98,7 @@ def upload_s3_object(
     obj: str | bytes | BinaryIO,
     content_type: str,
     metadata: dict[str, str] | None = None,
+    transfer_manager: S3TransferManager | None = None,
 ) -> None:
     if isinstance(obj, (bytes, bytearray)):
         body: BinaryIO = BytesIO(obj)
@@ -47,14 +107,19 @@ def upload_s3_object(
     else:
         body = obj
 
+    extra_args = _build_extra_args(
+        content_type=content_type,
+        metadata=metadata,
+    )
+    if transfer_manager is not None:
+        transfer_manager.upload(body, bucket, key, extra_args=extra_args).result()
+        return
     client.upload_fileobj(
         Fileobj=body,
         Bucket=bucket,
         Key=key,
-        ExtraArgs=_build_extra_args(
-            content_type=content_type,
-            metadata=metadata,
-        ),
+        ExtraArgs=extra_args,
+        Config=S3_UPLOAD_TRANSFER_CONFIG,
     )
 
 
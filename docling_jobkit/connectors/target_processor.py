@@ -31,6 +31,15 @@ class BaseTargetProcessor(AbstractContextManager, ABC):
     def result_mode(cls) -> Literal["artifacts", "archive", "presigned"]:
         return "artifacts"
 
+    @classmethod
+    def max_concurrent_uploads(cls) -> int:
+        """Number of uploads which may be issued concurrently from worker threads.
+
+        Processors whose client is not thread-safe keep the default of 1, which
+        makes callers upload sequentially.
+        """
+        return 1
+
     def __enter__(self):
         self._initialize()
         self._initialized = True
@@ -34,6 +34,7 @@ from docling.datamodel.pipeline_options import (
 )
 from docling.datamodel.pipeline_options_vlm_model import ApiVlmOptions, InlineVlmOptions
 from docling.datamodel.service.options import ConvertDocumentsOptions
+from docling.datamodel.settings import settings as docling_settings
 from docling.datamodel.vlm_engine_options import (
     ApiVlmEngineOptions,
     AutoInlineVlmEngineOptions,
@@ -163,6 +164,14 @@ class DoclingConverterManagerConfig(BaseModel):
     table_batch_size: Optional[int] = None
     batch_polling_interval_seconds: Optional[float] = None
 
+    # Document-level concurrency: up to doc_batch_concurrency documents of a
+    # doc_batch_size batch are converted at once, overlapping their I/O and CPU
+    # work. docling's DocumentConverter only reads these from its process-wide
+    # settings.perf, so they cannot be scoped to one manager's converters: the
+    # last manager constructed with a value sets it for the whole process.
+    doc_batch_size: Optional[int] = None
+    doc_batch_concurrency: Optional[int] = None
+
     # === NEW: Preset and Engine Control ===
 
     # VLM Pipeline Control
@@ -427,6 +436,8 @@ class DoclingConverterManager:
     def __init__(self, config: DoclingConverterManagerConfig):
         self.config = config
 
+        self._apply_doc_batch_settings()
+
         self.ocr_factory = get_ocr_factory(
             allow_external_plugins=self.config.allow_external_plugins
         )
@@ -453,6 +464,25 @@ class DoclingConverterManager:
         # Build kind registries
         self._build_kind_registries()
 
+    def _apply_doc_batch_settings(self) -> None:
+        """Apply the configured doc batch values to docling's process-wide settings.
+
+        docling offers no per-converter setting for them. Overwriting a value
+        another manager already changed is logged, as it affects its converters.
+        """
+        perf = docling_settings.perf
+        for name in ("doc_batch_size", "doc_batch_concurrency"):
+            value = getattr(self.config, name)
+            if value is None:
+                continue
+            current = getattr(perf, name)
+            if current != value and current != type(perf).model_fields[name].default:
+                _log.warning(
+                    f"Overriding docling's process-wide settings.perf.{name}="
+                    f"{current} with {value}, this applies to all converters."
+                )
+            setattr(perf, name, value)
+
     def _create_converter_cache_from_hash(
         self, cache_size: int
     ) -> Callable[[bytes], DocumentConverter]:
@@ -1464,48 +1494,64 @@ class DoclingConverterManager:
         # === NEW APPROACH for OCR with full custom config support ===
         ocr_options = self._parse_ocr_options(request)
 
-        pipeline_options = PdfPipelineOptions(
-            artifacts_path=artifacts_path,
-            allow_external_plugins=self.config.allow_external_plugins,
-            enable_remote_services=self.config.enable_remote_services,
-            document_timeout=request.document_timeout,
-            do_ocr=request.do_ocr,
-            ocr_options=ocr_options,
-            do_table_structure=request.do_table_structure,
-            do_code_enrichment=request.do_code_enrichment,
-            do_formula_enrichment=request.do_formula_enrichment,
-            do_picture_classification=request.do_picture_classification,
-            do_chart_extraction=request.do_chart_extraction,
-            do_picture_description=request.do_picture_description,
-        )
-        # === NEW KIND/PRESET-BASED APPROACH for Table Structure ===
-        pipeline_options.table_structure_options = self._parse_table_structure_options(
-            request
-        )
-
-        # === NEW PRESET/KIND-BASED APPROACH for Layout ===
-        # Always parse layout options (will use default if no preset/custom config)
-        pipeline_options.layout_options = self._parse_layout_options(request)
+        # All options known upfront are collected and validated in a single
+        # PdfPipelineOptions construction instead of one assignment each.
+        pipeline_kwargs: dict[str, Any] = {
+            "artifacts_path": artifacts_path,
+            "allow_external_plugins": self.config.allow_external_plugins,
+            "enable_remote_services": self.config.enable_remote_services,
+            "document_timeout": request.document_timeout,
+            "do_ocr": request.do_ocr,
+            "ocr_options": ocr_options,
+            "do_table_structure": request.do_table_structure,
+            "do_code_enrichment": request.do_code_enrichment,
+            "do_formula_enrichment": request.do_formula_enrichment,
+            "do_picture_classification": request.do_picture_classification,
+            "do_chart_extraction": request.do_chart_extraction,
+            "do_picture_description": request.do_picture_description,
+            # === NEW KIND/PRESET-BASED APPROACH for Table Structure ===
+            "table_structure_options": self._parse_table_structure_options(request),
+            # === NEW PRESET/KIND-BASED APPROACH for Layout ===
+            # Always parse layout options (will use default if no preset/custom config)
+            "layout_options": self._parse_layout_options(request),
+            # Which images to generate is controlled explicitly by include_images
+            # (picture/element images) and include_page_images (full-page images).
+            # How they are serialized (embedded/referenced/placeholder) is a separate
+            # concern handled at export time via image_export_mode.
+            "generate_picture_images": request.include_images,
+            "generate_page_images": request.include_page_images,
+        }
 
         # === NEW PRESET/KIND-BASED APPROACH for Picture Classification ===
         picture_classification_options = self._parse_picture_classification_options(
             request
         )
         if picture_classification_options is not None:
-            pipeline_options.picture_classification_options = (
+            pipeline_kwargs["picture_classification_options"] = (
                 picture_classification_options
             )
 
-        # Which images to generate is controlled explicitly by include_images
-        # (picture/element images) and include_page_images (full-page images).
-        # How they are serialized (embedded/referenced/placeholder) is a separate
-        # concern handled at export time via image_export_mode.
-        pipeline_options.generate_picture_images = request.include_images
-        pipeline_options.generate_page_images = request.include_page_images
-
         if request.include_images or request.include_page_images:
             if request.images_scale:
-                pipeline_options.images_scale = request.images_scale
+                pipeline_kwargs["images_scale"] = request.images_scale
+
+        # === NEW ENGINE-BASED APPROACH for Code Formula ===
+        new_code_formula_options = self._parse_code_formula_options(request)
+        if new_code_formula_options is not None:
+            pipeline_kwargs["code_formula_options"] = new_code_formula_options
+
+        # Forward the definition of the following attributes, if they are not none
+        for attr in (
+            "queue_max_size",
+            "ocr_batch_size",
+            "layout_batch_size",
+            "table_batch_size",
+            "batch_polling_interval_seconds",
+        ):
+            if value := getattr(self.config, attr):
+                pipeline_kwargs[attr] = value
+
+        pipeline_options = PdfPipelineOptions(**pipeline_kwargs)
 
         # === NEW ENGINE-BASED APPROACH for Picture Description ===
         new_picture_desc_options = self._parse_picture_description_options(request)
@@ -1533,22 +1579,6 @@ class DoclingConverterManager:
                 request.picture_description_area_threshold
             )
 
-        # === NEW ENGINE-BASED APPROACH for Code Formula ===
-        new_code_formula_options = self._parse_code_formula_options(request)
-        if new_code_formula_options is not None:
-            pipeline_options.code_formula_options = new_code_formula_options
-
-        # Forward the definition of the following attributes, if they are not none
-        for attr in (
-            "queue_max_size",
-            "ocr_batch_size",
-            "layout_batch_size",
-            "table_batch_size",
-            "batch_polling_interval_seconds",
-        ):
-            if value := getattr(self.config, attr):
-                setattr(pipeline_options, attr, value)
-
         return pipeline_options
 
     def _parse_backend(
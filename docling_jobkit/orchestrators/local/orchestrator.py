@@ -140,6 +140,13 @@ class LocalOrchestrator(BaseOrchestrator):
         converter = self.cm.get_converter(pdf_format_option)
         converter.initialize_pipeline(InputFormat.PDF)
 
+        # Chunker with default options, chunking is optional so a missing
+        # tokenizer must not fail the warm-up
+        try:
+            self.chunker_manager.warm_up()
+        except Exception as exc:
+            _log.warning(f"Could not warm up the default chunker: {exc}")
+
     async def delete_task(self, task_id: str):
         _log.info(f"Deleting result of task {task_id=}")
         if task_id in self._task_results:
@@ -269,9 +269,10 @@ class RayOrchestratorConfig(BaseSettings):
             "Hard time limit (seconds) for the blocking S3 source listing phase. "
             "If listing all objects across the source prefix(es) takes longer than "
             "this — due to an unreachable endpoint, slow network, or a very large "
-            "bucket — the task fails with a clear timeout error. The underlying "
-            "boto3 per-socket timeouts (connect_timeout / read_timeout in "
-            "get_s3_connection) still apply per operation; this is the outer bound."
+            "bucket — the task fails with a clear timeout error. Each S3 call is "
+            "still bounded by the boto3 socket timeouts and retry attempts of the "
+            "S3 clients (S3_CONNECT_TIMEOUT_S, read_timeout and S3_MAX_ATTEMPTS "
+            "in docling_jobkit.connectors.s3.helper); this is the outer bound."
         ),
     )
     s3_dispatch_batch_size: int = Field(
@@ -12,7 +12,7 @@ import time
 from copy import deepcopy
 from io import BytesIO
 from pathlib import Path
-from typing import Any, Iterator, Optional, cast
+from typing import Any, Iterable, Iterator, Optional, cast
 
 import ray
 from ray import ObjectRef, serve
@@ -140,7 +140,7 @@ def _is_pdf_source(source: Any) -> bool:
 
 def _to_exportable_documents(
     task: Task,
-    conv_results: list[ConversionResult],
+    conv_results: Iterable[ConversionResult],
 ) -> list[ExportableDocument]:
     return [
         ExportableDocument.from_conversion_result(
@@ -158,7 +158,7 @@ def _to_exportable_documents(
 
 def _to_exportable_documents_from_chunk(
     chunk: DocumentChunk[Any, Any],
-    conv_results: list[ConversionResult],
+    conv_results: Iterable[ConversionResult],
 ) -> list[ExportableDocument]:
     exportable: list[ExportableDocument] = []
     for idx, conv_res in enumerate(conv_results):
@@ -621,14 +621,13 @@ class DoclingProcessorConverterDeployment:
 
         if isinstance(request, PassthroughTaskRequest):
             request_start = time.monotonic()
-            conv_results = await self._run_with_retry(
+            exportable = await self._run_with_retry(
                 request.task.task_id,
                 lambda: self._convert_passthrough_task(request.task),
                 task=request.task,
             )
-            if isinstance(conv_results, ConverterFailureResult):
-                return conv_results
-            exportable = _to_exportable_documents(request.task, conv_results)
+            if isinstance(exportable, ConverterFailureResult):
+                return exportable
             result = await asyncio.to_thread(
                 lambda: self._build_task_result(
                     request.task,
@@ -639,11 +638,10 @@ class DoclingProcessorConverterDeployment:
             self.documents_processed += result.task_result.num_converted
         elif isinstance(request, MaterializedConvertRequest):
             request_start = time.monotonic()
-            conv_results = await self._run_with_retry(
+            exportable = await self._run_with_retry(
                 request.filename,
                 lambda: self._convert_materialized_request(request),
             )
-            exportable = _to_exportable_documents(request.task, conv_results)
             result = await asyncio.to_thread(
                 lambda: self._build_task_result(
                     request.task,
@@ -655,16 +653,13 @@ class DoclingProcessorConverterDeployment:
             self.documents_processed += result.task_result.num_converted
         elif isinstance(request, SourceChunkConvertRequest):
             request_start = time.monotonic()
-            conv_results = await self._run_with_retry(
+            exportable = await self._run_with_retry(
                 f"{request.task.task_id}:chunk:{request.chunk.chunk_index}",
                 lambda: self._convert_source_chunk_request(request),
                 task=request.task,
             )
-            if isinstance(conv_results, ConverterFailureResult):
-                return conv_results
-            exportable = _to_exportable_documents_from_chunk(
-                request.chunk, conv_results
-            )
+            if isinstance(exportable, ConverterFailureResult):
+                return exportable
             result = await asyncio.to_thread(
                 lambda: self._build_task_result(
                     request.task,
@@ -809,7 +804,11 @@ class DoclingProcessorConverterDeployment:
             processed_docs=processed_docs,
         )
 
-    def _convert_passthrough_task(self, task: Task) -> list[ConversionResult]:
+    # The _convert_* helpers turn each ConversionResult into an ExportableDocument
+    # as it is produced, so the pages and parser backends of a result are released
+    # before the next document is converted instead of piling up for the whole
+    # request.
+    def _convert_passthrough_task(self, task: Task) -> list[ExportableDocument]:
         _validate_no_s3_source_in_passthrough(task)
         convert_sources, headers = expand_task_sources(
             task,
@@ -817,39 +816,42 @@ class DoclingProcessorConverterDeployment:
             allow_external_plugins=self.converter_manager_config.allow_external_plugins,
         )
         convert_opts = task.convert_options or ConvertDocumentsOptions()
-        return list(
+        return _to_exportable_documents(
+            task,
             self.cm.convert_documents(
                 sources=convert_sources, options=convert_opts, headers=headers
-            )
+            ),
         )
 
     def _convert_materialized_request(
         self, request: MaterializedConvertRequest
-    ) -> list[ConversionResult]:
+    ) -> list[ExportableDocument]:
         payload = ray.get(request.artifact_ref)
-        return list(
+        return _to_exportable_documents(
+            request.task,
             self.cm.convert_documents(
                 sources=[
                     DocumentStream(name=request.filename, stream=BytesIO(payload))
                 ],
                 options=request.task.convert_options or ConvertDocumentsOptions(),
-            )
+            ),
         )
 
     def _convert_source_chunk_request(
         self, request: SourceChunkConvertRequest
-    ) -> list[ConversionResult]:
+    ) -> list[ExportableDocument]:
         with open_chunk_sources(
             request.chunk,
             max_file_size=self.converter_manager_config.max_file_size,
             allow_external_plugins=self.converter_manager_config.allow_external_plugins,
         ) as (convert_sources, headers):
-            return list(
+            return _to_exportable_documents_from_chunk(
+                request.chunk,
                 self.cm.convert_documents(
                     sources=convert_sources,
                     options=request.task.convert_options or ConvertDocumentsOptions(),
                     headers=headers,
-                )
+                ),
             )
 
     def _process_slice_convert(
@@ -1412,8 +1414,9 @@ class DoclingProcessorCoordinatorDeployment:
         #
         # Using asyncio.to_thread moves the entire listing into a worker thread.
         # asyncio.wait_for adds a hard outer time limit that catches:
-        #   - unreachable S3 endpoints (connect_timeout in boto3 caps per-attempt,
-        #     but listing a large bucket requires many paginator calls)
+        #   - unreachable S3 endpoints (connect_timeout caps each attempt and
+        #     S3_MAX_ATTEMPTS the attempts per call, but listing a large bucket
+        #     requires many paginator calls)
         #   - misconfigured credentials that cause silent retries or hangs
         #   - pathological S3 responses that are individually within boto3's
         #     read_timeout but collectively stall progress
@@ -15,7 +15,10 @@ from docling.datamodel.base_models import DocumentStream
 from docling.datamodel.service.sources import FileSource
 from docling.datamodel.service.tasks import TaskType
 
-from docling_jobkit.convert.chunking import process_chunkable_results
+from docling_jobkit.convert.chunking import (
+    DocumentChunkerManager,
+    process_chunkable_results,
+)
 from docling_jobkit.convert.manager import (
     DoclingConverterManager,
     DoclingConverterManagerConfig,
@@ -97,6 +100,7 @@ def _run_docling_task(
     orchestrator_config: RQOrchestratorConfig,
     scratch_dir: Path,
     *,
+    chunker_manager: Optional[DocumentChunkerManager] = None,
     phase_cm: Optional[_PhaseContextFactory] = None,
     on_source_prepared: Optional[_SourcePreparedHook] = None,
     on_sources_prepared: Optional[_SourcesPreparedHook] = None,
@@ -186,6 +190,7 @@ def _run_docling_task(
                         task=task,
                         exportable_documents=exportable_documents,
                         work_dir=workdir,
+                        chunker_manager=chunker_manager,
                         callback_invoker=callback_invoker,
                         debug_error_details=orchestrator_config.debug_error_details,
                     )
@@ -246,6 +251,7 @@ class CustomRQWorker(SimpleWorker):
     ):
         self.orchestrator_config = orchestrator_config
         self.conversion_manager = DoclingConverterManager(cm_config)
+        self.chunker_manager = DocumentChunkerManager()
         self.scratch_dir = scratch_dir
 
         if "default_result_ttl" not in kwargs:
@@ -296,6 +302,7 @@ class CustomRQWorker(SimpleWorker):
             # Add to job's kwargs conversion manager
             if hasattr(job, "kwargs"):
                 job.kwargs["conversion_manager"] = self.conversion_manager
+                job.kwargs["chunker_manager"] = self.chunker_manager
                 job.kwargs["orchestrator_config"] = self.orchestrator_config
                 job.kwargs["scratch_dir"] = self.scratch_dir
 
@@ -314,6 +321,7 @@ def docling_task(
     conversion_manager: DoclingConverterManager,
     orchestrator_config: RQOrchestratorConfig,
     scratch_dir: Path,
+    chunker_manager: Optional[DocumentChunkerManager] = None,
 ):
     _log.debug("started task")
     task = validate_task(
@@ -326,15 +334,22 @@ def docling_task(
         conversion_manager,
         orchestrator_config,
         scratch_dir,
+        chunker_manager=chunker_manager,
     )
     _log.debug("ended task")
     return result_key
 
 
-def clear_cache_task(conversion_manager: DoclingConverterManager, **_):
-    """RQ job that clears the converter cache on the worker."""
+def clear_cache_task(
+    conversion_manager: DoclingConverterManager,
+    chunker_manager: Optional[DocumentChunkerManager] = None,
+    **_,
+):
+    """RQ job that clears the converter and chunker caches on the worker."""
     _log.info("Clearing converter cache on worker")
     conversion_manager.clear_cache()
+    if chunker_manager is not None:
+        chunker_manager.clear_cache()
     import gc
 
     gc.collect()
@@ -357,6 +372,12 @@ def run_worker(
         cm_config=cm_config,
         scratch_dir=scratch_dir,
     )
+    # Load the default tokenizer before the first chunk job, chunking is
+    # optional so a missing tokenizer must not stop the worker
+    try:
+        worker.chunker_manager.warm_up()
+    except Exception as exc:
+        _log.warning(f"Could not warm up the default chunker: {exc}")
     worker.work()
 
 
@@ -30,6 +30,18 @@ from docling_jobkit.datamodel.task import Task
 from docling_jobkit.datamodel.task_meta import TaskType
 
 
+def _word_level_tokenizer():
+    """Build a tiny fast HuggingFace tokenizer, no model download needed."""
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import PreTrainedTokenizerFast
+
+    backend = Tokenizer(
+        models.WordLevel({"[UNK]": 0, "hello": 1, "world": 2}, unk_token="[UNK]")
+    )
+    backend.pre_tokenizer = pre_tokenizers.Whitespace()
+    return PreTrainedTokenizerFast(tokenizer_object=backend, unk_token="[UNK]")
+
+
 class TestDocumentChunker:
     """Test cases for DocumentChunker functionality."""
 
@@ -37,16 +49,93 @@ class TestDocumentChunker:
         """Test that DocumentChunker can be initialized."""
         chunker = DocumentChunkerManager()
         assert chunker is not None
-        assert chunker.config.cache_size == 10  # Default cache size
+        assert chunker.config.cache_size == 32  # Default cache size
         assert chunker._get_chunker_from_cache is not None
 
     def test_chunker_custom_config(self):
         """Test DocumentChunker with custom configuration."""
         from docling_jobkit.convert.chunking import DocumentChunkerConfig
 
-        config = DocumentChunkerConfig(cache_size=5)
+        config = DocumentChunkerConfig(cache_size=500, tokenizer_cache_size=2)
         chunker = DocumentChunkerManager(config=config)
-        assert chunker.config.cache_size == 5
+        assert chunker.config.cache_size == 500
+        assert chunker._get_chunker_from_cache.cache_info().maxsize == 500
+        assert chunker._get_tokenizer_from_cache.cache_info().maxsize == 2
+
+    def test_chunker_warm_up_fills_the_cache(self):
+        """Test that warm_up loads the chunker before the first request."""
+        chunker = DocumentChunkerManager()
+        options = HierarchicalChunkerOptions()
+
+        chunker.warm_up(options)
+
+        assert chunker._get_chunker_from_cache.cache_info().currsize == 1
+        chunker._get_chunker(options)
+        assert chunker._get_chunker_from_cache.cache_info().hits == 1
+
+    def test_chunker_lookups_from_concurrent_threads(self):
+        """Test that chunkers can be looked up from several threads at once."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        chunker = DocumentChunkerManager()
+        options = HierarchicalChunkerOptions()
+        chunker.warm_up(options)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            chunkers = list(
+                pool.map(lambda _: chunker._get_chunker(options), range(32))
+            )
+
+        assert len({id(c) for c in chunkers}) == 1
+        assert chunker._get_chunker_from_cache.cache_info().hits == 32
+
+    def test_chunk_document_collects_sorted_unique_page_numbers(self):
+        """Test the per-chunk refs, page numbers and metadata."""
+        from docling_core.types.doc.base import BoundingBox
+        from docling_core.types.doc.document import DoclingDocument, ProvenanceItem
+        from docling_core.types.doc.labels import DocItemLabel
+
+        doc = DoclingDocument(name="doc")
+        doc.add_heading("Title")
+        item = doc.add_text(label=DocItemLabel.TEXT, text="spans pages")
+        bbox = BoundingBox(l=0, t=0, r=1, b=1)
+        for page_no in (3, 1, 3):
+            item.prov.append(
+                ProvenanceItem(page_no=page_no, bbox=bbox, charspan=(0, 0))
+            )
+
+        chunks = list(
+            DocumentChunkerManager().chunk_document(
+                doc, "doc.pdf", HierarchicalChunkerOptions()
+            )
+        )
+
+        assert len(chunks) == 1
+        assert chunks[0].doc_items == [item.self_ref]
+        assert chunks[0].page_numbers == [1, 3]
+        assert chunks[0].headings == ["Title"]
+        assert chunks[0].metadata == {"has_image": False}
+
+    def test_chunk_document_yields_chunks_across_batches(self, monkeypatch):
+        """Test that chunks are streamed with continuous indices."""
+        from docling_core.types.doc.document import DoclingDocument
+        from docling_core.types.doc.labels import DocItemLabel
+
+        from docling_jobkit.convert import chunking
+
+        monkeypatch.setattr(chunking, "_TOKEN_COUNT_BATCH_SIZE", 2)
+        doc = DoclingDocument(name="doc")
+        for idx in range(5):
+            doc.add_text(label=DocItemLabel.TEXT, text=f"paragraph {idx}")
+
+        chunks = DocumentChunkerManager().chunk_document(
+            doc, "doc.pdf", HierarchicalChunkerOptions()
+        )
+
+        assert next(chunks).text == "paragraph 0"
+        assert [(chunk.chunk_index, chunk.text) for chunk in chunks] == [
+            (idx, f"paragraph {idx}") for idx in range(1, 5)
+        ]
 
     def test_chunking_options_defaults(self):
         """Test HybridChunkerOptions with default values."""
@@ -72,6 +161,133 @@ class TestDocumentChunker:
         assert options.merge_peers is False
         assert options.include_raw_text is True
 
+    def test_count_tokens_matches_per_text_counts(self):
+        """Test that the batched token count agrees with count_tokens."""
+        from docling_core.transforms.chunker.tokenizer.huggingface import (
+            HuggingFaceTokenizer,
+        )
+
+        from docling_jobkit.convert.chunking import _count_tokens
+
+        tokenizer = HuggingFaceTokenizer(
+            tokenizer=_word_level_tokenizer(), max_tokens=16
+        )
+        texts = ["hello world", "hello, unknown world!", ""]
+
+        assert _count_tokens(tokenizer, texts) == [
+            tokenizer.count_tokens(text) for text in texts
+        ]
+        assert _count_tokens(tokenizer, []) == []
+
+    def test_count_tokens_ignores_backend_truncation_and_padding(self):
+        """Test that a truncating, padding backend does not skew the counts."""
+        from docling_core.transforms.chunker.tokenizer.huggingface import (
+            HuggingFaceTokenizer,
+        )
+
+        from docling_jobkit.convert.chunking import _count_tokens
+
+        hf_tokenizer = _word_level_tokenizer()
+        hf_tokenizer.backend_tokenizer.enable_truncation(max_length=3)
+        hf_tokenizer.backend_tokenizer.enable_padding(length=8, pad_token="[UNK]")
+        tokenizer = HuggingFaceTokenizer(tokenizer=hf_tokenizer, max_tokens=16)
+
+        assert _count_tokens(tokenizer, ["hello world hello world hello", "hello"]) == [
+            5,
+            1,
+        ]
+
+    def test_chunker_tokenizer_caches_token_counts(self):
+        """Test that repeated texts are tokenized once for HybridChunker."""
+        from docling_core.transforms.chunker.hybrid_chunker import HybridChunker
+        from docling_core.types.doc.document import DoclingDocument
+        from docling_core.types.doc.labels import DocItemLabel
+
+        from docling_jobkit.convert.chunking import _CachingHuggingFaceTokenizer
+
+        tokenizer = _CachingHuggingFaceTokenizer(
+            tokenizer=_word_level_tokenizer(), max_tokens=16
+        )
+        assert tokenizer.count_tokens("hello world") == 2
+        assert tokenizer.count_tokens(text="hello world") == 2
+        assert tokenizer._count_tokens_cached.cache_info().hits == 1
+
+        doc = DoclingDocument(name="doc")
+        for _ in range(3):
+            doc.add_text(label=DocItemLabel.TEXT, text="hello world")
+        chunks = list(HybridChunker(tokenizer=tokenizer).chunk(doc))
+
+        assert chunks
+        assert tokenizer._count_tokens_cached.cache_info().hits > 1
+
+    def test_chunker_tokenizer_counts_long_texts_without_caching(self):
+        """Test that only short texts are kept in the token count memo."""
+        from docling_jobkit.convert.chunking import _CachingHuggingFaceTokenizer
+
+        tokenizer = _CachingHuggingFaceTokenizer(
+            tokenizer=_word_level_tokenizer(), max_tokens=16
+        )
+        long_text = " ".join(["hello"] * 100)
+
+        assert tokenizer.count_tokens(long_text) == 100
+        assert tokenizer.count_tokens(long_text) == 100
+        assert tokenizer._count_tokens_cached.cache_info().currsize == 0
+
+    def test_hybrid_chunkers_share_the_pretrained_tokenizer(self, monkeypatch):
+        """Test that the pretrained tokenizer is loaded once per name."""
+        from docling_jobkit.convert import chunking
+
+        loaded: list[str] = []
+
+        def _fake_load(model_name):
+            loaded.append(model_name)
+            return _word_level_tokenizer()
+
+        monkeypatch.setattr(chunking, "_load_pretrained_tokenizer", _fake_load)
+        chunker = DocumentChunkerManager()
+
+        small = chunker._get_chunker(HybridChunkerOptions(max_tokens=16))
+        large = chunker._get_chunker(
+            HybridChunkerOptions(max_tokens=32, use_markdown_tables=True)
+        )
+
+        assert loaded == ["sentence-transformers/all-MiniLM-L6-v2"]
+        assert small.tokenizer.get_tokenizer() is large.tokenizer.get_tokenizer()
+        assert small.tokenizer.get_max_tokens() == 16
+        assert large.tokenizer.get_max_tokens() == 32
+
+        chunker.clear_cache()
+        chunker._get_chunker(HybridChunkerOptions(max_tokens=16))
+        assert len(loaded) == 2
+
+    def test_concurrent_cold_lookups_build_the_chunker_once(self, monkeypatch):
+        """Test that threads missing the same key wait for a single build."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from docling_jobkit.convert import chunking
+
+        loaded: list[str] = []
+
+        def _slow_load(model_name):
+            loaded.append(model_name)
+            time.sleep(0.2)
+            return _word_level_tokenizer()
+
+        monkeypatch.setattr(chunking, "_load_pretrained_tokenizer", _slow_load)
+        chunker = DocumentChunkerManager()
+        options = HybridChunkerOptions(max_tokens=16)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            chunkers = list(pool.map(lambda _: chunker._get_chunker(options), range(4)))
+
+        assert len(loaded) == 1
+        assert len({id(c) for c in chunkers}) == 1
+        # The in-flight entry is dropped once the chunker is cached
+        assert chunker._pending_chunkers == {}
+        assert chunker._get_chunker(options) is chunkers[0]
+        assert len(loaded) == 1
+
     def test_chunk_conversion_result_failure(self):
         """Test chunking with failed conversion result."""
         failed_result = ExportableDocument(
@@ -150,7 +366,7 @@ class TestChunkedDocumentResponse:
         assert response.chunks[0].text == "Test content"
 
     def test_cache_key_generation(self):
-        """Test that cache key generation is deterministic and uses SHA1."""
+        """Test that cache key generation is deterministic."""
         chunker = DocumentChunkerManager()
 
         options1 = HybridChunkerOptions(
@@ -184,6 +400,10 @@ class TestChunkedDocumentResponse:
         assert key1 != key3
         assert key1 != key4
         assert key3 != key4
+        # include_raw_text does not change the chunker, it shares the cache entry
+        assert key1 == chunker._generate_cache_key(
+            options1.model_copy(update={"include_raw_text": True})
+        )
 
     def test_export_chunking_result(self):
         """Test that the full chunked result is exported as a single JSON file."""
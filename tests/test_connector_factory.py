@@ -489,7 +489,7 @@ def test_rq_worker_uses_explicit_external_plugin_policy(monkeypatch, tmp_path):
     )
     captured = {}
 
-    def capture_task(task, *args):
+    def capture_task(task, *args, **kwargs):
         captured["source"] = task.sources[0]
         captured["target"] = task.target
         return task
@@ -610,3 +610,45 @@ class TestGetVlmOptionsFromPreset:
         )
         assert options is not None
         assert options == custom_options
+
+
+class TestDocumentConcurrency:
+    """Test that document-level concurrency reaches docling's settings."""
+
+    def test_doc_batch_settings_are_applied(self, monkeypatch):
+        """Test that configured doc batch values are set, unset ones are kept."""
+        from docling.datamodel.settings import settings
+
+        # The values are process-wide, monkeypatch restores the originals
+        # after the test, including what the managers below write
+        monkeypatch.setattr(settings.perf, "doc_batch_size", 1)
+        monkeypatch.setattr(settings.perf, "doc_batch_concurrency", 1)
+
+        DoclingConverterManager(DoclingConverterManagerConfig())
+        assert settings.perf.doc_batch_size == 1
+        assert settings.perf.doc_batch_concurrency == 1
+
+        DoclingConverterManager(
+            DoclingConverterManagerConfig(doc_batch_size=4, doc_batch_concurrency=4)
+        )
+        assert settings.perf.doc_batch_size == 4
+        assert settings.perf.doc_batch_concurrency == 4
+
+    def test_doc_batch_settings_warn_when_overriding_another_manager(
+        self, monkeypatch, caplog
+    ):
+        """Test that overwriting another manager's doc batch value is logged."""
+        from docling.datamodel.settings import settings
+
+        monkeypatch.setattr(settings.perf, "doc_batch_size", 1)
+        monkeypatch.setattr(settings.perf, "doc_batch_concurrency", 1)
+
+        with caplog.at_level("WARNING", logger="docling_jobkit.convert.manager"):
+            DoclingConverterManager(DoclingConverterManagerConfig(doc_batch_size=4))
+            assert not caplog.records
+            DoclingConverterManager(DoclingConverterManagerConfig(doc_batch_size=8))
+
+        assert settings.perf.doc_batch_size == 8
+        assert [
+            "doc_batch_size=4 with 8" in r.getMessage() for r in caplog.records
+        ] == [True]
@@ -22,11 +22,19 @@ from docling_jobkit.connectors.google_drive.source_processor import (
 try:
     from google.auth.exceptions import RefreshError
 
+    from docling_jobkit.connectors.google_drive import helper
     from docling_jobkit.connectors.google_drive.helper import get_service
 except ImportError:
     pytest.skip("Google Drive dependencies are not installed", allow_module_level=True)
 
 
+@pytest.fixture(autouse=True)
+def _clear_credentials_cache():
+    helper._credentials_cache.clear()
+    yield
+    helper._credentials_cache.clear()
+
+
 def _coordinates() -> GoogleDriveCoordinates:
     return GoogleDriveCoordinates(
         path_id="folder-id",
@@ -134,3 +142,22 @@ def test_google_drive_browser_fallback_is_explicitly_enabled_for_cli() -> None:
 
     flow.run_local_server.assert_called_once_with(port=0)
     assert not is_interactive_auth_allowed()
+
+
+def test_google_drive_reuses_authorized_credentials_in_process() -> None:
+    credentials = MagicMock(valid=True, expired=False)
+
+    with (
+        patch(
+            "docling_jobkit.connectors.google_drive.helper.Credentials",
+            return_value=credentials,
+        ) as make_credentials,
+        patch("docling_jobkit.connectors.google_drive.helper.build") as build,
+    ):
+        get_service(_coordinates())
+        get_service(_coordinates())
+
+    make_credentials.assert_called_once()
+    credentials.refresh.assert_called_once()
+    assert build.call_count == 2
+    assert build.call_args.kwargs["credentials"] is credentials
@@ -0,0 +1,190 @@
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+
+try:
+    from docling_jobkit.connectors.google_drive import helper
+    from docling_jobkit.connectors.google_drive.helper import (
+        GoogleDriveFileIdentifier,
+        download_file,
+    )
+except ImportError:
+    pytest.skip("Google Drive dependencies are not installed", allow_module_level=True)
+
+
+class _RangeHttp:
+    def __init__(self, payload: bytes, requested: list[str]):
+        self._payload = payload
+        self._requested = requested
+
+    def request(self, uri, method, headers):
+        del uri, method
+        byte_range = headers["range"]
+        self._requested.append(byte_range)
+        start, end = map(int, byte_range.removeprefix("bytes=").split("-"))
+        return SimpleNamespace(status=206), self._payload[start : end + 1]
+
+
+class _FakeFiles:
+    def get_media(self, fileId, supportsAllDrives):
+        del supportsAllDrives
+        return SimpleNamespace(
+            uri=f"https://drive.example/{fileId}?alt=media",
+            headers={"user-agent": "test"},
+            http=SimpleNamespace(credentials=object()),
+        )
+
+
+class _FakeService:
+    def files(self):
+        return _FakeFiles()
+
+
+def test_download_file_fetches_large_files_as_concurrent_ranges(monkeypatch):
+    payload = bytes(range(256)) * 100
+    requested: list[str] = []
+    monkeypatch.setattr(helper, "DOWNLOAD_CHUNK_SIZE", 4096)
+    monkeypatch.setattr(
+        helper, "_authorized_http", lambda _creds: _RangeHttp(payload, requested)
+    )
+
+    file_stream = BytesIO()
+    download_file(
+        _FakeService(),
+        GoogleDriveFileIdentifier(
+            id="file-id",
+            name="large.pdf",
+            mime_type="application/pdf",
+            path="folder/large.pdf",
+            size=len(payload),
+        ),
+        file_stream,
+    )
+
+    assert file_stream.getvalue() == payload
+    assert len(requested) == 7
+    assert "bytes=24576-25599" in requested
+
+
+class _FakeBatch:
+    def __init__(self, callback, calls: list[int]):
+        self._callback = callback
+        self._calls = calls
+        self._requests: list[tuple[str, dict]] = []
+
+    def add(self, request, request_id):
+        self._requests.append((request_id, request))
+
+    def execute(self):
+        self._calls.append(len(self._requests))
+        for request_id, response in self._requests:
+            self._callback(request_id, response, None)
+
+
+class _TreeFiles:
+    def __init__(self, tree: dict[str, list[dict]]):
+        self._tree = tree
+
+    def get(self, fileId, fields, supportsAllDrives):
+        del fields, supportsAllDrives
+        return SimpleNamespace(
+            execute=lambda: {
+                "id": fileId,
+                "name": "root",
+                "mimeType": "application/vnd.google-apps.folder",
+            }
+        )
+
+    def list(self, q, pageToken, **_kwargs):
+        folder_id = q.split("'")[1]
+        children = self._tree.get(folder_id, [])
+        # Serve every folder listing as two pages
+        if pageToken is None:
+            return {"files": children[:1], "nextPageToken": "page-2"}
+        return {"files": children[1:]}
+
+
+class _TreeService:
+    def __init__(self, tree: dict[str, list[dict]]):
+        self._files = _TreeFiles(tree)
+        self.batch_sizes: list[int] = []
+
+    def files(self):
+        return self._files
+
+    def new_batch_http_request(self, callback):
+        return _FakeBatch(callback, self.batch_sizes)
+
+
+def test_source_files_infos_lists_each_folder_level_in_batches():
+    folder = "application/vnd.google-apps.folder"
+    tree = {
+        "root-id": [
+            {"id": "a", "name": "a", "mimeType": folder},
+            {"id": "b", "name": "b", "mimeType": folder},
+            {"id": "top", "name": "top.pdf", "mimeType": "application/pdf"},
+        ],
+        "a": [
+            {"id": "a1", "name": "one.pdf", "mimeType": "application/pdf"},
+            {"id": "c", "name": "c", "mimeType": folder},
+        ],
+        "b": [{"id": "b1", "name": "two.pdf", "mimeType": "application/pdf"}],
+        "c": [{"id": "c1", "name": "three.pdf", "mimeType": "application/pdf"}],
+    }
+    service = _TreeService(tree)
+
+    infos = helper.get_source_files_infos(service, SimpleNamespace(path_id="root-id"))
+
+    assert sorted(info.path for info in infos) == [
+        "root/a/c/three.pdf",
+        "root/a/one.pdf",
+        "root/b/two.pdf",
+        "root/top.pdf",
+    ]
+    # One batch per level for the first pages, one for the follow-up pages
+    assert service.batch_sizes == [1, 1, 2, 2, 1, 1]
+
+
+class _UploadRequest:
+    def __init__(self, media_body):
+        self.media_body = media_body
+
+    def execute(self):
+        return {"id": "new-id", "name": "out.md", "webViewLink": "https://drive"}
+
+    def next_chunk(self):
+        raise AssertionError("small uploads must not open a resumable session")
+
+
+class _UploadFiles:
+    def __init__(self):
+        self.created: list[_UploadRequest] = []
+
+    def get(self, fileId, fields, supportsAllDrives):
+        del fileId, fields, supportsAllDrives
+        return SimpleNamespace(
+            execute=lambda: {"mimeType": "application/vnd.google-apps.folder"}
+        )
+
+    def create(self, body, media_body, fields, supportsAllDrives):
+        del body, fields, supportsAllDrives
+        request = _UploadRequest(media_body)
+        self.created.append(request)
+        return request
+
+
+def test_upload_file_sends_small_files_in_one_request():
+    files = _UploadFiles()
+    service = SimpleNamespace(files=lambda: files)
+
+    helper.upload_file(
+        service,
+        target_filename="out.md",
+        content_type="text/markdown",
+        coords=SimpleNamespace(path_id="folder-id"),
+        file_stream=BytesIO(b"# title"),
+    )
+
+    assert len(files.created) == 1
+    assert not files.created[0].media_body.resumable()
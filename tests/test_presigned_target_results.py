@@ -1,14 +1,19 @@
 import base64
 from datetime import datetime, timezone
 from hashlib import sha256
+from io import BytesIO
 from pathlib import Path
 from typing import ClassVar, Literal
 from unittest.mock import MagicMock
 
+import boto3
 import pytest
+from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from pydantic import BaseModel
 
-from docling.datamodel.base_models import ConversionStatus, OutputFormat
+from docling.datamodel.base_models import ConversionStatus, InputFormat, OutputFormat
+from docling.datamodel.document import ConversionResult, InputDocument, _DummyBackend
 from docling.datamodel.service.callbacks import CallbackSpec, ProgressKind
 from docling.datamodel.service.requests import (
     AnyHttpSourceRequest as HttpSource,
@@ -28,12 +33,22 @@ from docling_core.types.doc.document import DoclingDocument
 from docling_jobkit.config.target_config import S3PresignedConfig
 from docling_jobkit.connectors.artifact_paths import hash_path_component
 from docling_jobkit.connectors.connector_factory import TargetConnectorFactory
-from docling_jobkit.connectors.s3.helper import check_target_has_source_converted
+from docling_jobkit.connectors.s3.helper import (
+    check_target_has_source_converted,
+    get_converted_source_root,
+)
+from docling_jobkit.connectors.s3.presigned_target_processor import (
+    S3PresignedTargetProcessor,
+)
+from docling_jobkit.connectors.s3.target_processor import S3TargetProcessor
+from docling_jobkit.connectors.s3.upload_support import create_s3_transfer_manager
 from docling_jobkit.connectors.target_processor import BaseTargetProcessor
 from docling_jobkit.convert.results import process_exportable_results
+from docling_jobkit.convert.results_processor import ResultsProcessor
 from docling_jobkit.datamodel.convert import ConvertDocumentsOptions
 from docling_jobkit.datamodel.exportable_document import ExportableDocument
 from docling_jobkit.datamodel.result import PresignedArtifactResult, RemoteTargetResult
+from docling_jobkit.datamodel.source_identity import SourceIdentity
 from docling_jobkit.datamodel.task import Task
 
 
@@ -41,7 +56,7 @@ class _FakeS3Client:
     def __init__(self):
         self.uploads: list[dict[str, object]] = []
 
-    def upload_file(self, Filename, Bucket, Key, ExtraArgs):
+    def upload_file(self, Filename, Bucket, Key, ExtraArgs, Config=None):
         self.uploads.append(
             {
                 "bucket": Bucket,
@@ -51,7 +66,7 @@ class _FakeS3Client:
             }
         )
 
-    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs):
+    def upload_fileobj(self, Fileobj, Bucket, Key, ExtraArgs, Config=None):
         self.uploads.append(
             {
                 "bucket": Bucket,
@@ -69,6 +84,16 @@ class _FakeS3Client:
         return None
 
 
+@pytest.fixture(autouse=True)
+def _upload_through_fake_client(monkeypatch: pytest.MonkeyPatch):
+    # Without a transfer manager the uploads go to the client's upload_file
+    # and upload_fileobj, which _FakeS3Client records.
+    monkeypatch.setattr(
+        "docling_jobkit.connectors.s3.target_processor.create_s3_transfer_manager",
+        lambda _client, _max_concurrent_uploads: None,
+    )
+
+
 class _FakeDoc(DoclingDocument):
     markdown_image_modes: ClassVar[list[ImageRefMode]] = []
 
@@ -251,8 +276,8 @@ def test_process_exportable_results_returns_presigned_artifact_result(
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
 
     task_result = process_exportable_results(
@@ -302,8 +327,8 @@ def test_process_exportable_results_omits_default_tenant_id_from_object_metadata
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
     task = _make_task().model_copy(update={"metadata": {"user_id": "user-1"}})
 
@@ -330,8 +355,8 @@ def test_process_exportable_results_reuses_presigned_artifact_result_for_multi_d
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
 
     task_result = process_exportable_results(
@@ -356,8 +381,8 @@ def test_presigned_target_duplicate_source_uris_share_storage_keys(
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
 
     task_result = process_exportable_results(
@@ -413,8 +438,8 @@ def test_process_exportable_results_returns_remote_target_result_for_s3_target(
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
     task = _make_task().model_copy(
         update={
@@ -600,14 +625,14 @@ def test_presigned_callbacks_emit_document_completed_after_uploads(
     events: list[tuple[str, object]] = []
 
     class _RecordingS3Client(_FakeS3Client):
-        def upload_file(self, Filename, Bucket, Key, ExtraArgs):
-            super().upload_file(Filename, Bucket, Key, ExtraArgs)
+        def upload_file(self, Filename, Bucket, Key, ExtraArgs, Config=None):
+            super().upload_file(Filename, Bucket, Key, ExtraArgs, Config)
             events.append(("upload", Key))
 
     fake_client = _RecordingS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
 
     callback_invoker = MagicMock()
@@ -650,8 +675,8 @@ def test_document_completed_num_characters_uses_placeholder_image_mode(
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
     _FakeDoc.markdown_image_modes = []
 
@@ -681,8 +706,8 @@ def test_presigned_remote_exports_release_document_references_and_cleanup_temp_d
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
     exportable_documents = [
         _make_exportable_document(source_index=0),
@@ -706,14 +731,14 @@ def test_presigned_upload_failure_becomes_failed_document_callback(
     monkeypatch: pytest.MonkeyPatch,
 ):
     class _FailingS3Client(_FakeS3Client):
-        def upload_file(self, Filename, Bucket, Key, ExtraArgs):
-            del Filename, Bucket, Key, ExtraArgs
+        def upload_file(self, Filename, Bucket, Key, ExtraArgs, Config=None):
+            del Filename, Bucket, Key, ExtraArgs, Config
             raise RuntimeError("upload failed")
 
     fake_client = _FailingS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
 
     callback_invoker = MagicMock()
@@ -757,8 +782,8 @@ def test_s3_target_uses_distinct_task_scoped_keys_for_same_basename_sources(
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
     task = Task(
         task_id="task-123",
@@ -803,8 +828,8 @@ def test_s3_target_uses_s3_source_coordinates_hash_for_s3_inputs(
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
     task = Task(
         task_id="task-123",
@@ -871,50 +896,240 @@ def test_check_target_has_source_converted_uses_hashed_source_root(
     seen_prefixes: list[str] = []
 
     class _FakePaginator:
-        pass
+        def paginate(self, Bucket, Prefix):
+            del Bucket
+            seen_prefixes.append(Prefix)
+            yield {"Contents": [{"Key": f"{Prefix}paper.json"}]}
 
     class _FakeClient:
         def get_paginator(self, _name):
             return _FakePaginator()
 
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.helper.get_s3_connection",
-        lambda _coords: (_FakeClient(), object()),
+        "docling_jobkit.connectors.s3.helper.get_s3_client",
+        lambda _coords: _FakeClient(),
+    )
+
+    filtered = check_target_has_source_converted(
+        target_coords,
+        ["incoming/documents/paper.pdf", "incoming/documents/other.pdf"],
+        source_coords,
+    )
+
+    assert seen_prefixes == [f"converted/{expected_source_hash}/json/"]
+    assert filtered == ["incoming/documents/other.pdf"]
+
+
+def test_check_target_has_source_converted_with_head_lookups(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    target_coords = S3Coordinates(
+        endpoint="s3.target.example.com",
+        access_key="target-key",
+        secret_key="target-secret",
+        bucket="converted-docs",
+        key_prefix="converted/",
+    )
+    source_coords = S3Coordinates(
+        endpoint="s3.source.example.com",
+        access_key="source-key",
+        secret_key="source-secret",
+        bucket="source-bucket",
+        key_prefix="incoming/documents",
+    )
+    expected_source_hash = hash_path_component(
+        "s3.source.example.com|source-bucket|incoming/documents"
+    )
+    converted_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    head_keys: list[str] = []
+
+    class _FakeClient:
+        def get_paginator(self, _name):
+            raise AssertionError("the target prefix must not be listed")
+
+        def head_object(self, Bucket, Key):
+            del Bucket
+            head_keys.append(Key)
+            if Key.endswith("/paper.json"):
+                return {"LastModified": converted_at}
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+    monkeypatch.setattr(
+        "docling_jobkit.connectors.s3.helper.get_s3_client",
+        lambda _coords: _FakeClient(),
+    )
+
+    filtered = check_target_has_source_converted(
+        target_coords,
+        ["incoming/documents/paper.pdf", "incoming/documents/other.pdf"],
+        source_coords,
+        head_lookups=True,
     )
 
-    def _fake_count(_paginator, _bucket, prefix):
-        seen_prefixes.append(prefix)
-        return 1
+    assert sorted(head_keys) == [
+        f"converted/{expected_source_hash}/json/other.json",
+        f"converted/{expected_source_hash}/json/paper.json",
+    ]
+    assert filtered == ["incoming/documents/other.pdf"]
 
+
+def test_bundled_exports_are_found_by_the_converted_source_check(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    class _ListingS3Client(_FakeS3Client):
+        def get_paginator(self, _name):
+            return self
+
+        def paginate(self, Bucket, Prefix):
+            del Bucket
+            yield {
+                "Contents": [
+                    {"Key": item["key"]}
+                    for item in self.uploads
+                    if str(item["key"]).startswith(Prefix)
+                ]
+            }
+
+    fake_client = _ListingS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.helper.count_s3_objects",
-        _fake_count,
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.helper.get_keys_s3_objects_as_set",
-        lambda _resource, _bucket, prefix: {
-            f"{prefix}paper.json",
-        },
+        "docling_jobkit.connectors.s3.helper.get_s3_client",
+        lambda _coords: fake_client,
+    )
+    target_coords = S3Coordinates(
+        endpoint="s3.target.example.com",
+        access_key="key",
+        secret_key="secret",
+        bucket="converted-docs",
+        key_prefix="converted/",
+    )
+    source_coords = S3Coordinates(
+        endpoint="s3.source.example.com",
+        access_key="source-key",
+        secret_key="source-secret",
+        bucket="source-bucket",
+        key_prefix="incoming/documents",
+    )
+    input_path = tmp_path / "paper.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=input_path,
+            format=InputFormat.PDF,
+            backend=_DummyBackend,
+        ),
+        status=ConversionStatus.SUCCESS,
+        document=DoclingDocument(name="paper"),
     )
 
+    with S3TargetProcessor(target_coords) as target_processor:
+        list(
+            ResultsProcessor(
+                target_processor=target_processor,
+                to_formats=["json", "md"],
+                scratch_dir=tmp_path / "scratch",
+                artifact_root_prefix=get_converted_source_root(source_coords),
+                bundle_exports=True,
+            ).process_documents([conv_res])
+        )
+
     filtered = check_target_has_source_converted(
         target_coords,
         ["incoming/documents/paper.pdf", "incoming/documents/other.pdf"],
         source_coords,
     )
 
-    assert seen_prefixes == [f"converted/{expected_source_hash}/json/"]
     assert filtered == ["incoming/documents/other.pdf"]
 
 
+def test_head_lookups_find_outputs_of_sources_streamed_by_key(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    converted_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    class _HeadS3Client(_FakeS3Client):
+        def head_object(self, Bucket, Key):
+            del Bucket
+            if any(item["key"] == Key for item in self.uploads):
+                return {"LastModified": converted_at}
+            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+
+    fake_client = _HeadS3Client()
+    monkeypatch.setattr(
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
+    )
+    monkeypatch.setattr(
+        "docling_jobkit.connectors.s3.helper.get_s3_client",
+        lambda _coords: fake_client,
+    )
+    target_coords = S3Coordinates(
+        endpoint="s3.target.example.com",
+        access_key="key",
+        secret_key="secret",
+        bucket="converted-docs",
+        key_prefix="converted/",
+    )
+    source_coords = S3Coordinates(
+        endpoint="s3.source.example.com",
+        access_key="source-key",
+        secret_key="source-secret",
+        bucket="source-bucket",
+        key_prefix="incoming/documents",
+    )
+    source_key = "incoming/documents/2024/paper.pdf"
+    # Named like the streams from prefetch_s3_objects, by the full source key
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=BytesIO(b"%PDF-1.4"),
+            filename=source_key,
+            format=InputFormat.PDF,
+            backend=_DummyBackend,
+        ),
+        status=ConversionStatus.SUCCESS,
+        document=DoclingDocument(name="paper"),
+    )
+
+    with S3TargetProcessor(target_coords) as target_processor:
+        list(
+            ResultsProcessor(
+                target_processor=target_processor,
+                to_formats=["json"],
+                scratch_dir=tmp_path / "scratch",
+                artifact_root_prefix=get_converted_source_root(source_coords),
+            ).process_documents([conv_res])
+        )
+
+    sources = [source_key, "incoming/documents/2024/other.pdf"]
+    assert check_target_has_source_converted(
+        target_coords,
+        sources,
+        source_coords,
+        head_lookups=True,
+        outputs_named_by_key=True,
+    ) == ["incoming/documents/2024/other.pdf"]
+    # Looked up by the bare stem, the nested output is not found
+    assert (
+        check_target_has_source_converted(
+            target_coords, sources, source_coords, head_lookups=True
+        )
+        == sources
+    )
+
+
 def test_process_exportable_results_tracks_partial_success_counts(
     tmp_path: Path,
     monkeypatch: pytest.MonkeyPatch,
 ):
     fake_client = _FakeS3Client()
     monkeypatch.setattr(
-        "docling_jobkit.connectors.s3.target_processor.get_s3_connection",
-        lambda _coords: (fake_client, object()),
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: fake_client,
     )
 
     task_result = process_exportable_results(
@@ -930,3 +1145,102 @@ def test_process_exportable_results_tracks_partial_success_counts(
     assert task_result.num_succeeded == 1
     assert task_result.num_partially_succeeded == 1
     assert task_result.num_failed == 0
+
+
+def test_s3_target_reuses_one_transfer_manager(monkeypatch: pytest.MonkeyPatch):
+    client = boto3.client(
+        "s3",
+        region_name="us-east-1",
+        aws_access_key_id="key",
+        aws_secret_access_key="secret",
+    )
+    sent_keys: list[str] = []
+    client.meta.events.register(
+        "before-parameter-build.s3.PutObject",
+        lambda params, **_kwargs: sent_keys.append(params["Key"]),
+    )
+    stubber = Stubber(client)
+    for _ in range(2):
+        stubber.add_response("put_object", {})
+    stubber.activate()
+
+    managers: list[object] = []
+
+    def _create_manager(s3_client, max_concurrent_uploads):
+        manager = create_s3_transfer_manager(s3_client, max_concurrent_uploads)
+        managers.append(manager)
+        return manager
+
+    monkeypatch.setattr(
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: client,
+    )
+    monkeypatch.setattr(
+        "docling_jobkit.connectors.s3.target_processor.create_s3_transfer_manager",
+        _create_manager,
+    )
+    coords = S3Coordinates(
+        endpoint="s3.example.com",
+        access_key="key",
+        secret_key="secret",
+        bucket="converted-docs",
+        key_prefix="converted/",
+    )
+
+    with S3TargetProcessor(coords) as processor:
+        processor.upload_object("{}", "a.json", "application/json")
+        processor.upload_object(b"# a", "a.md", "text/markdown")
+
+    stubber.assert_no_pending_responses()
+    assert len(managers) == 1
+    assert sent_keys == ["converted/a.json", "converted/a.md"]
+
+
+def test_presigned_artifacts_do_not_depend_on_upload_completion_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(
+        "docling_jobkit.connectors.s3.target_processor.create_s3_client",
+        lambda _coords: _FakeS3Client(),
+    )
+    source = SourceIdentity(
+        source_index=0,
+        source_uri="paper.pdf",
+        source_key=_short_hash("paper.pdf"),
+    )
+    exports = [
+        ("resource_bundle", "paper_bundle.zip", "application/zip"),
+        ("markdown", "paper.md", "text/markdown"),
+        ("json", "paper.json", "application/json"),
+    ]
+    for _artifact_type, target_filename, _mime_type in exports:
+        (tmp_path / target_filename).write_bytes(b"data")
+
+    artifact_types = []
+    for completion_order in (exports, exports[::-1]):
+        with S3PresignedTargetProcessor(
+            PresignedUrlTarget(),
+            s3_presigned_config=_make_s3_presigned_config(),
+            task=_make_task(),
+        ) as processor:
+            for artifact_type, target_filename, mime_type in completion_order:
+                processor.upload_artifact_file(
+                    source=source,
+                    artifact_type=artifact_type,
+                    path=tmp_path / target_filename,
+                    target_filename=target_filename,
+                    mime_type=mime_type,
+                )
+            document = processor.build_document_artifact_item(
+                source=source,
+                filename="paper.pdf",
+                status=ConversionStatus.SUCCESS,
+                errors=[],
+                timings={},
+            )
+        artifact_types.append(
+            [artifact.artifact_type for artifact in document.artifacts]
+        )
+
+    assert artifact_types == [["json", "markdown", "resource_bundle"]] * 2
@@ -1,8 +1,16 @@
+import threading
+import weakref
+import zipfile
+from io import BytesIO
 from pathlib import Path
 
+import pandas as pd
+import pytest
+from PIL import Image
+
 from docling.datamodel.base_models import ConversionStatus, InputFormat
 from docling.datamodel.document import ConversionResult, InputDocument, _DummyBackend
-from docling_core.types.doc.document import DoclingDocument
+from docling_core.types.doc.document import DoclingDocument, ImageRef, PageItem, Size
 
 from docling_jobkit.connectors.target_processor import BaseTargetProcessor
 from docling_jobkit.convert.results_processor import ResultsProcessor
@@ -12,6 +20,7 @@ class _RecordingTargetProcessor(BaseTargetProcessor):
     def __init__(self):
         super().__init__()
         self.uploads: list[tuple[str, str, str | bytes]] = []
+        self.uploaded_files: dict[str, bytes] = {}
 
     def _initialize(self) -> None:
         return None
@@ -25,8 +34,10 @@ class _RecordingTargetProcessor(BaseTargetProcessor):
         target_filename: str,
         content_type: str,
     ) -> None:
+        data = Path(filename).read_bytes()
+        self.uploaded_files[target_filename] = data
         self.uploads.append(
-            (target_filename, content_type, Path(filename).read_text(encoding="utf-8"))
+            (target_filename, content_type, data.decode("utf-8", errors="replace"))
         )
 
     def upload_object(
@@ -49,8 +60,8 @@ class _FakeDoc(DoclingDocument):
     def export_to_markdown(self, **_kwargs):
         return "# title"
 
-    def save_as_html(self, filename):
-        Path(filename).write_text("<p>ok</p>", encoding="utf-8")
+    def export_to_html(self, **_kwargs):
+        return "<p>ok</p>"
 
     def export_to_text(self):
         return "plain text"
@@ -88,7 +99,238 @@ def test_results_processor_uses_narrow_base_target_processor_contract(tmp_path:
     assert len(uploaded_targets) == 6
     assert uploaded_targets[0].endswith("input.doctags.txt")
     assert uploaded_targets[1].endswith("input.html")
+    assert ("text/html", "<p>ok</p>") in {
+        (content_type, obj) for _target, content_type, obj in target_processor.uploads
+    }
     assert uploaded_targets[2].endswith("input.json")
     assert uploaded_targets[3].endswith("input.md")
     assert uploaded_targets[4].endswith("input.pdf")
     assert uploaded_targets[5].endswith("input.txt")
+
+
+def test_results_processor_bundles_exports_into_one_upload(tmp_path: Path):
+    input_path = tmp_path / "input.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=input_path,
+            format=InputFormat.PDF,
+            backend=_DummyBackend,
+        ),
+        status=ConversionStatus.SUCCESS,
+        document=_FakeDoc.model_construct(),
+    )
+
+    with _RecordingTargetProcessor() as target_processor:
+        list(
+            ResultsProcessor(
+                target_processor=target_processor,
+                to_formats=["json", "md", "text"],
+                scratch_dir=tmp_path / "scratch",
+                bundle_exports=True,
+            ).process_documents([conv_res])
+        )
+
+    uploaded_targets = sorted(
+        target for target, _type, _obj in target_processor.uploads
+    )
+    assert len(uploaded_targets) == 3
+    assert uploaded_targets[0].startswith("bundle/")
+    assert uploaded_targets[0].endswith("input.zip")
+    # The json output also stays on its own, it marks the document converted
+    assert uploaded_targets[1].startswith("json/")
+    assert uploaded_targets[1].endswith("input.json")
+    assert uploaded_targets[2].endswith("input.pdf")
+
+    bundle_bytes = target_processor.uploaded_files[uploaded_targets[0]]
+    with zipfile.ZipFile(BytesIO(bundle_bytes)) as bundle:
+        contents = {name.split("/")[0]: bundle.read(name) for name in bundle.namelist()}
+    assert contents == {
+        "json": b'{"ok": true}',
+        "md": b"# title",
+        "txt": b"plain text",
+    }
+
+
+def test_results_processor_releases_result_before_yielding(tmp_path: Path):
+    input_path = tmp_path / "input.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    result_refs: list[weakref.ref] = []
+
+    def _make_result() -> ConversionResult:
+        conv_res = ConversionResult(
+            input=InputDocument(
+                path_or_stream=input_path,
+                format=InputFormat.PDF,
+                backend=_DummyBackend,
+            ),
+            status=ConversionStatus.FAILURE,
+        )
+        result_refs.append(weakref.ref(conv_res))
+        return conv_res
+
+    def _results():
+        yield _make_result()
+
+    with _RecordingTargetProcessor() as target_processor:
+        processed = ResultsProcessor(
+            target_processor=target_processor,
+            scratch_dir=tmp_path / "scratch",
+        ).process_documents(_results())
+
+        assert next(processed).endswith(" - FAILURE")
+        # The generator is suspended at its yield, the result must be gone.
+        assert result_refs[0]() is None
+
+
+def test_results_processor_uploads_page_images_concurrently(tmp_path: Path):
+    class _ConcurrentTargetProcessor(_RecordingTargetProcessor):
+        @classmethod
+        def max_concurrent_uploads(cls) -> int:
+            return 4
+
+    pages = {
+        page_no: PageItem(
+            page_no=page_no,
+            size=Size(width=4, height=4),
+            image=ImageRef.from_pil(Image.new("RGB", (4, 4)), dpi=72),
+        )
+        for page_no in range(1, 7)
+    }
+
+    with _ConcurrentTargetProcessor() as target_processor:
+        ResultsProcessor(
+            target_processor=target_processor,
+            scratch_dir=tmp_path / "scratch",
+        ).upload_page_images(pages, "doc-hash")
+
+    uploaded_targets = {target for target, _type, _obj in target_processor.uploads}
+    assert len(uploaded_targets) == 6
+    for _target, content_type, obj in target_processor.uploads:
+        assert content_type == "image/png"
+        assert Image.open(obj).size == (4, 4)
+    assert all(target.startswith("pages/") for target in uploaded_targets)
+    assert {
+        f"pages/{Path(str(page.image.uri)).name}"
+        for page in pages.values()
+        if page.image is not None
+    } == uploaded_targets
+
+
+def test_results_processor_uploads_format_exports_concurrently(tmp_path: Path):
+    # Six uploads (pdf + five formats), each waits until all of them are in flight
+    barrier = threading.Barrier(6, timeout=5)
+
+    class _ConcurrentTargetProcessor(_RecordingTargetProcessor):
+        @classmethod
+        def max_concurrent_uploads(cls) -> int:
+            return 8
+
+        def upload_file(self, filename, target_filename, content_type) -> None:
+            barrier.wait()
+            super().upload_file(filename, target_filename, content_type)
+
+        def upload_object(self, obj, target_filename, content_type) -> None:
+            barrier.wait()
+            super().upload_object(obj, target_filename, content_type)
+
+    input_path = tmp_path / "input.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=input_path,
+            format=InputFormat.PDF,
+            backend=_DummyBackend,
+        ),
+        status=ConversionStatus.SUCCESS,
+        document=_FakeDoc.model_construct(),
+    )
+
+    with _ConcurrentTargetProcessor() as target_processor:
+        list(
+            ResultsProcessor(
+                target_processor=target_processor,
+                to_formats=["json", "doctags", "md", "html", "text"],
+                scratch_dir=tmp_path / "scratch",
+            ).process_documents([conv_res])
+        )
+
+    assert len(target_processor.uploads) == 6
+    json_key = next(k for k in target_processor.uploaded_files if k.endswith(".json"))
+    assert target_processor.uploaded_files[json_key] == b'{"ok": true}'
+
+
+def test_results_processor_closes_bundle_when_an_export_fails(
+    tmp_path: Path, monkeypatch
+):
+    class _FailingDoc(_FakeDoc):
+        def export_to_markdown(self, **_kwargs):
+            raise RuntimeError("export failed")
+
+    opened: list[zipfile.ZipFile] = []
+    zip_file_cls = zipfile.ZipFile
+
+    def _recording_zip_file(*args, **kwargs):
+        opened.append(zip_file_cls(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(zipfile, "ZipFile", _recording_zip_file)
+
+    input_path = tmp_path / "input.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=input_path,
+            format=InputFormat.PDF,
+            backend=_DummyBackend,
+        ),
+        status=ConversionStatus.SUCCESS,
+        document=_FailingDoc.model_construct(),
+    )
+
+    with _RecordingTargetProcessor() as target_processor:
+        with pytest.raises(RuntimeError, match="export failed"):
+            list(
+                ResultsProcessor(
+                    target_processor=target_processor,
+                    to_formats=["json", "md"],
+                    scratch_dir=tmp_path / "scratch",
+                    bundle_exports=True,
+                ).process_documents([conv_res])
+            )
+
+    assert len(opened) == 1
+    assert opened[0].fp is None
+    assert not any(
+        target.startswith("bundle/") for target, _type, _obj in target_processor.uploads
+    )
+
+
+def test_results_processor_parquet_keeps_raw_page_pixels(tmp_path: Path):
+    page_image = Image.new("RGB", (4, 4), color=(10, 20, 30))
+    document = DoclingDocument(name="input")
+    document.pages[1] = PageItem(
+        page_no=1,
+        size=Size(width=4, height=4),
+        image=ImageRef.from_pil(page_image, dpi=72),
+    )
+    input_path = tmp_path / "input.pdf"
+    input_path.write_bytes(b"%PDF-1.4")
+    conv_res = ConversionResult(
+        input=InputDocument(
+            path_or_stream=input_path,
+            format=InputFormat.PDF,
+            backend=_DummyBackend,
+        ),
+        status=ConversionStatus.SUCCESS,
+        document=document,
+    )
+
+    with _RecordingTargetProcessor() as target_processor:
+        frame = ResultsProcessor(
+            target_processor=target_processor,
+            scratch_dir=tmp_path / "scratch",
+        ).document_to_dataframe(conv_res, pd.DataFrame(), "input")
+
+    assert frame["page_images"].iloc[0] == [page_image.tobytes()]
@@ -45,6 +45,7 @@ from docling_jobkit.orchestrators.rq.orchestrator import (
 from docling_jobkit.orchestrators.rq.worker import (
     CustomRQWorker,
     _prepare_convert_sources,
+    clear_cache_task,
 )
 
 
@@ -296,6 +297,24 @@ async def test_delete_task_cleans_up_job(orchestrator: RQOrchestrator):
         pass
 
 
+def test_clear_cache_task_clears_chunker_cache():
+    from unittest.mock import MagicMock
+
+    from docling_jobkit.convert.chunking import DocumentChunkerManager
+    from docling_jobkit.datamodel.chunking import HierarchicalChunkerOptions
+
+    conversion_manager = MagicMock()
+    chunker_manager = DocumentChunkerManager()
+    chunker_manager.warm_up(HierarchicalChunkerOptions())
+
+    clear_cache_task(
+        conversion_manager=conversion_manager, chunker_manager=chunker_manager
+    )
+
+    conversion_manager.clear_cache.assert_called_once_with()
+    assert chunker_manager._get_chunker_from_cache.cache_info().currsize == 0
+
+
 @pytest.mark.asyncio
 async def test_clear_converters_clears_worker_cache():
     """Test that clear_converters enqueues a job that clears the worker's converter cache."""
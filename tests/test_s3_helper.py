@@ -1,4 +1,65 @@
-from docling_jobkit.connectors.s3.helper import strip_prefix_postfix
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from docling.datamodel.base_models import InputFormat
+from docling.datamodel.service.sources import S3Coordinates
+
+from docling_jobkit.connectors.s3.helper import (
+    count_s3_objects,
+    filter_converted_source_keys,
+    filter_source_keys_by_format,
+    generate_batch_keys,
+    generate_presign_urls,
+    get_keys_s3_objects_as_set,
+    get_s3_client,
+    get_source_files,
+    iter_s3_keys,
+    iter_unconverted_source_keys,
+    list_s3_keys_parallel,
+    list_s3_keys_sharded,
+    list_source_files,
+    prefetch_s3_objects,
+    strip_prefix_postfix,
+)
+
+
+class _FakePaginator:
+    def __init__(self, keys: list[str]):
+        self._keys = keys
+
+    def paginate(self, Bucket, Prefix, Delimiter=None, StartAfter=None):
+        del Bucket
+        contents = []
+        common_prefixes = set()
+        for key in sorted(self._keys):
+            if not key.startswith(Prefix):
+                continue
+            if StartAfter is not None and key <= StartAfter:
+                continue
+            rest = key[len(Prefix) :]
+            if Delimiter and Delimiter in rest:
+                common_prefixes.add(Prefix + rest.split(Delimiter)[0] + Delimiter)
+            else:
+                contents.append({"Key": key})
+        yield {
+            "Contents": contents,
+            "CommonPrefixes": [{"Prefix": cp} for cp in sorted(common_prefixes)],
+        }
+
+
+class _FakeS3Client:
+    def __init__(self, keys: list[str]):
+        self._keys = keys
+
+    def get_paginator(self, _name):
+        return _FakePaginator(self._keys)
+
+
+class _FakeS3Resource:
+    def __init__(self, keys: list[str]):
+        self.meta = SimpleNamespace(client=_FakeS3Client(keys))
 
 
 def test_strip_prefix_postfix():
@@ -7,3 +68,264 @@ def test_strip_prefix_postfix():
 
     assert len(in_set) == len(out_set)
     assert out_set == {"file_1", "file_2"}
+
+
+def test_strip_prefix_postfix_only_strips_at_the_ends():
+    in_set = {"mypath/json/mypath/json/file.json.json", "other/file.json"}
+    out_set = strip_prefix_postfix(in_set, prefix="mypath/json/", extension=".json")
+
+    assert out_set == {"mypath/json/file.json", "other/file"}
+    assert strip_prefix_postfix(in_set) == in_set
+
+
+def test_generate_batch_keys():
+    keys = [f"doc_{idx}.pdf" for idx in range(7)]
+
+    assert generate_batch_keys(keys, batch_size=3) == [
+        ["doc_0.pdf", "doc_1.pdf", "doc_2.pdf"],
+        ["doc_3.pdf", "doc_4.pdf", "doc_5.pdf"],
+        ["doc_6.pdf"],
+    ]
+    assert generate_batch_keys([], batch_size=3) == []
+
+
+def test_listing_uses_client_paginator():
+    keys = ["docs/a.pdf", "docs/sub/b.pdf", "other/c.pdf"]
+
+    assert count_s3_objects(_FakePaginator(keys), "bucket", "docs/") == 2
+    assert get_keys_s3_objects_as_set(_FakeS3Resource(keys), "bucket", "docs/") == {
+        "docs/a.pdf",
+        "docs/sub/b.pdf",
+    }
+
+
+def test_list_s3_keys_parallel_walks_sub_prefixes():
+    keys = [
+        "docs/top.pdf",
+        "docs/a/one.pdf",
+        "docs/a/deep/two.pdf",
+        "docs/b/three.pdf",
+        "other/skip.pdf",
+    ]
+    client = _FakeS3Client(keys)
+
+    listed = list_s3_keys_parallel(client, "bucket", "docs/", max_workers=2)
+
+    assert listed == {
+        "docs/top.pdf",
+        "docs/a/one.pdf",
+        "docs/a/deep/two.pdf",
+        "docs/b/three.pdf",
+    }
+
+
+def test_list_s3_keys_sharded_covers_keys_outside_shard_chars():
+    keys = [
+        "docs/0.pdf",
+        "docs/1",
+        "docs/1a.pdf",
+        "docs/5/nested.pdf",
+        "docs/f.pdf",
+        "docs/Upper.pdf",
+        "docs/_underscore.pdf",
+        "docs/~tilde.pdf",
+        "other/skip.pdf",
+    ]
+    client = _FakeS3Client(keys)
+
+    listed = list_s3_keys_sharded(
+        client, "bucket", "docs/", shard_chars="1f5", max_workers=3
+    )
+
+    assert listed == {key for key in keys if key.startswith("docs/")}
+
+
+def test_generate_presign_urls_keeps_key_order_and_skips_failures():
+    class _PresignClient:
+        def generate_presigned_url(self, ClientMethod, Params, ExpiresIn):
+            del ClientMethod, ExpiresIn
+            if Params["Key"] == "broken.pdf":
+                raise RuntimeError("cannot sign")
+            return f"https://example.com/{Params['Bucket']}/{Params['Key']}"
+
+    urls = list(
+        generate_presign_urls(
+            _PresignClient(),
+            ["a.pdf", "broken.pdf", "b.pdf", "c.pdf"],
+            "bucket",
+            max_workers=3,
+        )
+    )
+
+    assert urls == [
+        "https://example.com/bucket/a.pdf",
+        "https://example.com/bucket/b.pdf",
+        "https://example.com/bucket/c.pdf",
+    ]
+
+
+def test_prefetch_s3_objects_keeps_key_order_and_skips_failures():
+    class _DownloadClient:
+        def download_fileobj(self, Bucket, Key, Fileobj, Config):
+            del Bucket, Config
+            if Key == "broken.pdf":
+                raise RuntimeError("cannot download")
+            Fileobj.write(Key.encode())
+
+    streams = list(
+        prefetch_s3_objects(
+            _DownloadClient(),
+            ["a.pdf", "broken.pdf", "b.pdf", "c.pdf"],
+            "bucket",
+            max_workers=2,
+            max_buffered_bytes=1,
+        )
+    )
+
+    assert [stream.name for stream in streams] == ["a.pdf", "b.pdf", "c.pdf"]
+    assert [stream.stream.read() for stream in streams] == [
+        b"a.pdf",
+        b"b.pdf",
+        b"c.pdf",
+    ]
+
+
+def test_get_s3_client_is_shared_per_endpoint_and_credentials():
+    coords = S3Coordinates(
+        endpoint="localhost:9000",
+        verify_ssl=False,
+        access_key="key",
+        secret_key="secret",
+        bucket="source",
+        key_prefix="docs",
+    )
+    other_bucket = coords.model_copy(update={"bucket": "target"})
+    other_key = coords.model_copy(update={"access_key": "other"})
+
+    assert get_s3_client(coords) is get_s3_client(other_bucket)
+    assert get_s3_client(coords) is not get_s3_client(other_key)
+
+
+def test_filter_converted_source_keys_matches_on_file_stem():
+    source_keys = [
+        "docs/a/report.pdf",
+        "docs/b/report.docx",
+        "docs/paper.tar.gz",
+        "docs/new.pdf",
+    ]
+
+    filtered = filter_converted_source_keys(source_keys, {"report", "paper.tar"})
+
+    assert filtered == ["docs/new.pdf"]
+
+
+def test_filter_converted_source_keys_keeps_sources_modified_after_conversion():
+    converted_at = datetime(2026, 1, 2, tzinfo=timezone.utc)
+    source_keys = ["docs/unchanged.pdf", "docs/updated.pdf", "docs/new.pdf"]
+
+    filtered = filter_converted_source_keys(
+        source_keys,
+        {"unchanged": converted_at, "updated": converted_at},
+        {
+            "docs/unchanged.pdf": datetime(2026, 1, 1, tzinfo=timezone.utc),
+            "docs/updated.pdf": datetime(2026, 1, 3, tzinfo=timezone.utc),
+            "docs/new.pdf": datetime(2026, 1, 3, tzinfo=timezone.utc),
+        },
+    )
+
+    assert filtered == ["docs/updated.pdf", "docs/new.pdf"]
+
+
+def test_filter_source_keys_by_format_matches_extensions_case_insensitively():
+    source_keys = ["docs/a.pdf", "docs/B.PDF", "docs/scan.png", "docs/notes.txt"]
+
+    assert filter_source_keys_by_format(source_keys, [InputFormat.PDF]) == [
+        "docs/a.pdf",
+        "docs/B.PDF",
+    ]
+    assert filter_source_keys_by_format(
+        source_keys, [InputFormat.PDF, InputFormat.IMAGE]
+    ) == ["docs/a.pdf", "docs/B.PDF", "docs/scan.png"]
+
+
+def test_filter_source_keys_by_format_requires_a_suffix():
+    source_keys = ["docs/pdf", "docs.pdf/readme", "docs/archive.TAR.GZ"]
+
+    assert filter_source_keys_by_format(source_keys, list(InputFormat)) == [
+        "docs/archive.TAR.GZ"
+    ]
+
+
+def test_list_source_files_lists_the_prefix_once():
+    keys = ["docs/a.pdf", "docs/b.pdf", "other/c.pdf"]
+    calls: list[str] = []
+
+    class _CountingClient(_FakeS3Client):
+        def get_paginator(self, _name):
+            calls.append(_name)
+            return super().get_paginator(_name)
+
+    coords = S3Coordinates(
+        endpoint="localhost:9000",
+        verify_ssl=False,
+        access_key="key",
+        secret_key="secret",
+        bucket="source",
+        key_prefix="docs",
+    )
+
+    listed = list_source_files(_CountingClient(keys), coords)
+
+    assert listed == {"docs/a.pdf", "docs/b.pdf"}
+    assert calls == ["list_objects_v2"]
+
+
+def test_get_source_files_is_a_deprecated_alias():
+    coords = S3Coordinates(
+        endpoint="localhost:9000",
+        verify_ssl=False,
+        access_key="key",
+        secret_key="secret",
+        bucket="source",
+        key_prefix="docs",
+    )
+    client = _FakeS3Client(["docs/a.pdf"])
+
+    with pytest.warns(DeprecationWarning, match="list_source_files"):
+        listed = get_source_files(client, object(), coords)
+
+    assert listed == list_source_files(client, coords) == {"docs/a.pdf"}
+
+
+def test_iter_unconverted_source_keys_streams_the_listing():
+    pages_listed: list[int] = []
+
+    class _PagedClient:
+        def get_paginator(self, _name):
+            return self
+
+        def paginate(self, Bucket, Prefix):
+            del Bucket, Prefix
+            for page_no, key in enumerate(["docs/a.pdf", "docs/b.pdf", "docs/c.pdf"]):
+                pages_listed.append(page_no)
+                yield {"Contents": [{"Key": key}]}
+
+    unconverted = iter_unconverted_source_keys(
+        iter_s3_keys(_PagedClient(), "bucket", "docs/"), {"a"}
+    )
+
+    assert next(unconverted) == "docs/b.pdf"
+    # Nothing is listed ahead of the consumer
+    assert pages_listed == [0, 1]
+    assert list(unconverted) == ["docs/c.pdf"]
+
+
+def test_s3_clients_fail_fast_on_unreachable_endpoints(monkeypatch):
+    from docling_jobkit.connectors.s3 import helper
+
+    config = helper._s3_config()
+    assert config.connect_timeout == 10
+    assert config.retries == {"max_attempts": 2, "mode": "adaptive"}
+
+    monkeypatch.setattr(helper, "S3_MAX_ATTEMPTS", 5)
+    assert helper._s3_config().retries["max_attempts"] == 5